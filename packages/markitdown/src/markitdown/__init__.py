@@ -2,12 +2,10 @@
 #
 # SPDX-License-Identifier: MIT
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .__about__ import __version__
-from ._markitdown import (
-    MarkItDown,
-    PRIORITY_SPECIFIC_FILE_FORMAT,
-    PRIORITY_GENERIC_FILE_FORMAT,
-)
 from ._base_converter import DocumentConverterResult, DocumentConverter
 from ._stream_info import StreamInfo
 from ._exceptions import (
@@ -32,3 +30,31 @@ __all__ = [
     "PRIORITY_SPECIFIC_FILE_FORMAT",
     "PRIORITY_GENERIC_FILE_FORMAT",
 ]
+
+# MarkItDown (and with it magika, requests, etc.) is imported on first access
+# (PEP 562), so that e.g. `markitdown --version` doesn't pay for it.
+_LAZY_IMPORTS = {
+    "MarkItDown": "._markitdown",
+    "PRIORITY_SPECIFIC_FILE_FORMAT": "._markitdown",
+    "PRIORITY_GENERIC_FILE_FORMAT": "._markitdown",
+}
+
+if TYPE_CHECKING:
+    from ._markitdown import (
+        MarkItDown,
+        PRIORITY_SPECIFIC_FILE_FORMAT,
+        PRIORITY_GENERIC_FILE_FORMAT,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache, so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
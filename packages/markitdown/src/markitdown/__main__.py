@@ -5,9 +5,9 @@ import argparse
 import sys
 import codecs
 from textwrap import dedent
-from importlib.metadata import entry_points
 from .__about__ import __version__
-from ._markitdown import MarkItDown, StreamInfo, DocumentConverterResult
+from ._stream_info import StreamInfo
+from ._base_converter import DocumentConverterResult
 
 
 def main():
@@ -157,6 +157,8 @@ def main():
 
     if args.list_plugins:
         # List installed plugins, then exit
+        from importlib.metadata import entry_points
+
         print("Installed MarkItDown 3rd-party Plugins:\n")
         plugin_entry_points = list(entry_points(group="markitdown.plugin"))
         if len(plugin_entry_points) == 0:
@@ -172,6 +174,9 @@ def main():
             )
         sys.exit(0)
 
+    # Imported here, so that --version, --help, etc. don't have to load it
+    from ._markitdown import MarkItDown
+
     if args.use_docintel:
         if args.endpoint is None:
             _exit_with_error(
@@ -206,12 +211,21 @@ def _handle_output(args, result: DocumentConverterResult):
         with open(args.output, "w", encoding="utf-8") as f:
             f.write(result.markdown)
     else:
-        # Handle stdout encoding errors more gracefully
-        print(
-            result.markdown.encode(sys.stdout.encoding, errors="replace").decode(
-                sys.stdout.encoding
+        # Handle stdout encoding errors more gracefully. Writing the encoded
+        # bytes directly avoids decoding the whole document again.
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            encoding = sys.stdout.encoding or "utf-8"
+            sys.stdout.flush()
+            buffer.write(result.markdown.encode(encoding, errors="replace"))
+            buffer.write(b"\n")
+            buffer.flush()
+        else:
+            print(
+                result.markdown.encode(sys.stdout.encoding, errors="replace").decode(
+                    sys.stdout.encoding
+                )
             )
-        )
 
 
 def _exit_with_error(message: str):
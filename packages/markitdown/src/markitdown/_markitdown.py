@@ -1,8 +1,10 @@
 import mimetypes
+import functools
 import os
 import re
 import sys
 import shutil
+import threading
 import traceback
 import io
 from dataclasses import dataclass
@@ -19,28 +21,6 @@ import codecs
 from ._stream_info import StreamInfo
 from ._uri_utils import parse_data_uri, file_uri_to_path
 
-from .converters import (
-    PlainTextConverter,
-    HtmlConverter,
-    RssConverter,
-    WikipediaConverter,
-    YouTubeConverter,
-    IpynbConverter,
-    BingSerpConverter,
-    PdfConverter,
-    DocxConverter,
-    XlsxConverter,
-    XlsConverter,
-    PptxConverter,
-    ImageConverter,
-    AudioConverter,
-    OutlookMsgConverter,
-    ZipConverter,
-    EpubConverter,
-    DocumentIntelligenceConverter,
-    CsvConverter,
-)
-
 from ._base_converter import DocumentConverter, DocumentConverterResult
 
 from ._exceptions import (
@@ -58,29 +38,35 @@ PRIORITY_GENERIC_FILE_FORMAT = (
     10.0  # Near catch-all converters for mimetypes like text/*, etc.
 )
 
+# Streams shorter than this are classified without invoking the magika model.
+MAGIKA_MIN_STREAM_SIZE = 16
+
 
 _plugins: Union[None, List[Any]] = None  # If None, plugins have not been loaded yet.
+_plugins_lock = threading.Lock()
 
 
 def _load_plugins() -> Union[None, List[Any]]:
-    """Lazy load plugins, exiting early if already loaded."""
+    """Lazy load plugins, exiting early if already loaded. Safe to call from multiple threads."""
     global _plugins
 
-    # Skip if we've already loaded plugins
-    if _plugins is not None:
+    with _plugins_lock:
+        # Skip if we've already loaded plugins
+        if _plugins is not None:
+            return _plugins
+
+        # Load plugins
+        plugins: List[Any] = []
+        for entry_point in entry_points(group="markitdown.plugin"):
+            try:
+                plugins.append(entry_point.load())
+            except Exception:
+                tb = traceback.format_exc()
+                warn(f"Plugin '{entry_point.name}' failed to load ... skipping:\n{tb}")
+
+        _plugins = plugins
         return _plugins
 
-    # Load plugins
-    _plugins = []
-    for entry_point in entry_points(group="markitdown.plugin"):
-        try:
-            _plugins.append(entry_point.load())
-        except Exception:
-            tb = traceback.format_exc()
-            warn(f"Plugin '{entry_point.name}' failed to load ... skipping:\n{tb}")
-
-    return _plugins
-
 
 @dataclass(kw_only=True, frozen=True)
 class ConverterRegistration:
@@ -104,6 +90,11 @@ class MarkItDown:
         self._builtins_enabled = False
         self._plugins_enabled = False
 
+        # Discover plugins in the background, so that the entry point scan
+        # overlaps with loading the magika model and the built-in converters
+        if enable_plugins and _plugins is None:
+            threading.Thread(target=_load_plugins, daemon=True).start()
+
         requests_session = kwargs.get("requests_session")
         if requests_session is None:
             self._requests_session = requests.Session()
@@ -136,6 +127,28 @@ class MarkItDown:
         This method should only be called once, if built-ins were initially disabled.
         """
         if not self._builtins_enabled:
+            # Imported here, since importing the converters is slow
+            from .converters import (
+                PlainTextConverter,
+                HtmlConverter,
+                RssConverter,
+                WikipediaConverter,
+                YouTubeConverter,
+                IpynbConverter,
+                BingSerpConverter,
+                PdfConverter,
+                DocxConverter,
+                XlsxConverter,
+                XlsConverter,
+                PptxConverter,
+                ImageConverter,
+                AudioConverter,
+                OutlookMsgConverter,
+                ZipConverter,
+                EpubConverter,
+                CsvConverter,
+            )
+
             # TODO: Move these into converter constructors
             self._llm_client = kwargs.get("llm_client")
             self._llm_model = kwargs.get("llm_model")
@@ -197,6 +210,8 @@ class MarkItDown:
             # Register Document Intelligence converter at the top of the stack if endpoint is provided
             docintel_endpoint = kwargs.get("docintel_endpoint")
             if docintel_endpoint is not None:
+                from .converters import DocumentIntelligenceConverter
+
                 docintel_args: Dict[str, Any] = {}
                 docintel_args["endpoint"] = docintel_endpoint
 
@@ -256,12 +271,7 @@ class MarkItDown:
 
         # Local path or url
         if isinstance(source, str):
-            if (
-                source.startswith("http:")
-                or source.startswith("https:")
-                or source.startswith("file:")
-                or source.startswith("data:")
-            ):
+            if source.startswith(("http:", "https:", "file:", "data:")):
                 # Rename the url argument to mock_url
                 # (Deprecated -- use stream_info)
                 _kwargs = {k: v for k, v in kwargs.items()}
@@ -439,7 +449,7 @@ class MarkItDown:
                 **kwargs,
             )
         # HTTP/HTTPS URIs
-        elif uri.startswith("http:") or uri.startswith("https:"):
+        elif uri.startswith(("http:", "https:")):
             response = self._requests_session.get(uri, stream=True)
             response.raise_for_status()
             return self.convert_response(
@@ -542,39 +552,43 @@ class MarkItDown:
         # Remember the initial stream position so that we can return to it
         cur_pos = file_stream.tell()
 
-        for stream_info in stream_info_guesses + [StreamInfo()]:
-            for converter_registration in sorted_registrations:
-                converter = converter_registration.converter
-                # Sanity check -- make sure the cur_pos is still the same
-                assert (
-                    cur_pos == file_stream.tell()
-                ), "File stream position should NOT change between guess iterations"
+        # Prepare the options passed to every converter. These don't depend on
+        # the guess or the converter, so build them once rather than per attempt.
+        base_kwargs = {k: v for k, v in kwargs.items()}
 
-                _kwargs = {k: v for k, v in kwargs.items()}
+        # Copy any additional global options
+        if "llm_client" not in base_kwargs and self._llm_client is not None:
+            base_kwargs["llm_client"] = self._llm_client
 
-                # Copy any additional global options
-                if "llm_client" not in _kwargs and self._llm_client is not None:
-                    _kwargs["llm_client"] = self._llm_client
+        if "llm_model" not in base_kwargs and self._llm_model is not None:
+            base_kwargs["llm_model"] = self._llm_model
 
-                if "llm_model" not in _kwargs and self._llm_model is not None:
-                    _kwargs["llm_model"] = self._llm_model
+        if "style_map" not in base_kwargs and self._style_map is not None:
+            base_kwargs["style_map"] = self._style_map
 
-                if "style_map" not in _kwargs and self._style_map is not None:
-                    _kwargs["style_map"] = self._style_map
+        if "exiftool_path" not in base_kwargs and self._exiftool_path is not None:
+            base_kwargs["exiftool_path"] = self._exiftool_path
 
-                if "exiftool_path" not in _kwargs and self._exiftool_path is not None:
-                    _kwargs["exiftool_path"] = self._exiftool_path
+        # Add the list of converters for nested processing
+        base_kwargs["_parent_converters"] = self._converters
 
-                # Add the list of converters for nested processing
-                _kwargs["_parent_converters"] = self._converters
+        for stream_info in stream_info_guesses + [StreamInfo()]:
+            _kwargs = {k: v for k, v in base_kwargs.items()}
+
+            # Add legaxy kwargs
+            if stream_info is not None:
+                if stream_info.extension is not None:
+                    _kwargs["file_extension"] = stream_info.extension
 
-                # Add legaxy kwargs
-                if stream_info is not None:
-                    if stream_info.extension is not None:
-                        _kwargs["file_extension"] = stream_info.extension
+                if stream_info.url is not None:
+                    _kwargs["url"] = stream_info.url
 
-                    if stream_info.url is not None:
-                        _kwargs["url"] = stream_info.url
+            for converter_registration in sorted_registrations:
+                converter = converter_registration.converter
+                # Sanity check -- make sure the cur_pos is still the same
+                assert (
+                    cur_pos == file_stream.tell()
+                ), "File stream position should NOT change between guess iterations"
 
                 # Check if the converter will accept the file, and if so, try to convert it
                 _accepts = False
@@ -671,29 +685,51 @@ class MarkItDown:
 
         # If there's an extension and no mimetype, try to guess the mimetype
         if base_guess.mimetype is None and base_guess.extension is not None:
-            _m, _ = mimetypes.guess_type(
-                "placeholder" + base_guess.extension, strict=False
-            )
+            _m = _guess_mimetype_from_extension(base_guess.extension)
             if _m is not None:
                 enhanced_guess = enhanced_guess.copy_and_update(mimetype=_m)
 
         # If there's a mimetype and no extension, try to guess the extension
         if base_guess.mimetype is not None and base_guess.extension is None:
-            _e = mimetypes.guess_all_extensions(base_guess.mimetype, strict=False)
-            if len(_e) > 0:
-                enhanced_guess = enhanced_guess.copy_and_update(extension=_e[0])
+            _e = _guess_extension_from_mimetype(base_guess.mimetype)
+            if _e is not None:
+                enhanced_guess = enhanced_guess.copy_and_update(extension=_e)
 
         # Call magika to guess from the stream
         cur_pos = file_stream.tell()
         try:
-            result = self._magika.identify_stream(file_stream)
-            if result.status == "ok" and result.prediction.output.label != "unknown":
+            guessed_mimetype: Optional[str] = None
+            guessed_extensions: List[str] = []
+            is_text = False
+
+            # Read the first 4k once. It is reused below to guess the charset.
+            stream_page = file_stream.read(4096)
+            file_stream.seek(cur_pos)
+
+            # Very short streams carry too little signal for the model, so
+            # classify them directly (text if they decode as UTF-8)
+            if len(stream_page) < MAGIKA_MIN_STREAM_SIZE:
+                if len(stream_page) > 0 and _is_utf8(stream_page):
+                    guessed_mimetype = "text/plain"
+                    guessed_extensions = ["txt"]
+                    is_text = True
+            else:
+                # identify_stream() seeks within the stream and only reads the
+                # fixed-size blocks the model looks at (the beginning and end of
+                # the stream), so large files are never read in full here
+                result = self._magika.identify_stream(file_stream)
+                if (
+                    result.status == "ok"
+                    and result.prediction.output.label != "unknown"
+                ):
+                    guessed_mimetype = result.prediction.output.mime_type
+                    guessed_extensions = result.prediction.output.extensions
+                    is_text = result.prediction.output.is_text
+
+            if guessed_mimetype is not None:
                 # If it's text, also guess the charset
                 charset = None
-                if result.prediction.output.is_text:
-                    # Read the first 4k to guess the charset
-                    file_stream.seek(cur_pos)
-                    stream_page = file_stream.read(4096)
+                if is_text:
                     charset_result = charset_normalizer.from_bytes(stream_page).best()
 
                     if charset_result is not None:
@@ -701,21 +737,20 @@ class MarkItDown:
 
                 # Normalize the first extension listed
                 guessed_extension = None
-                if len(result.prediction.output.extensions) > 0:
-                    guessed_extension = "." + result.prediction.output.extensions[0]
+                if len(guessed_extensions) > 0:
+                    guessed_extension = "." + guessed_extensions[0]
 
                 # Determine if the guess is compatible with the base guess
                 compatible = True
                 if (
                     base_guess.mimetype is not None
-                    and base_guess.mimetype != result.prediction.output.mime_type
+                    and base_guess.mimetype != guessed_mimetype
                 ):
                     compatible = False
 
                 if (
                     base_guess.extension is not None
-                    and base_guess.extension.lstrip(".")
-                    not in result.prediction.output.extensions
+                    and base_guess.extension.lstrip(".") not in guessed_extensions
                 ):
                     compatible = False
 
@@ -729,8 +764,7 @@ class MarkItDown:
                     # Add the compatible base guess
                     guesses.append(
                         StreamInfo(
-                            mimetype=base_guess.mimetype
-                            or result.prediction.output.mime_type,
+                            mimetype=base_guess.mimetype or guessed_mimetype,
                             extension=base_guess.extension or guessed_extension,
                             charset=base_guess.charset or charset,
                             filename=base_guess.filename,
@@ -743,7 +777,7 @@ class MarkItDown:
                     guesses.append(enhanced_guess)
                     guesses.append(
                         StreamInfo(
-                            mimetype=result.prediction.output.mime_type,
+                            mimetype=guessed_mimetype,
                             extension=guessed_extension,
                             charset=charset,
                             filename=base_guess.filename,
@@ -763,9 +797,45 @@ class MarkItDown:
         """
         Normalize a charset string to a canonical form.
         """
-        if charset is None:
-            return None
-        try:
-            return codecs.lookup(charset).name
-        except LookupError:
-            return charset
+        return _normalize_charset(charset)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_charset(charset: str | None) -> str | None:
+    """
+    Normalize a charset string to a canonical form. Results are cached, since
+    the same handful of charset names are looked up over and over.
+    """
+    if charset is None:
+        return None
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return charset
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_mimetype_from_extension(extension: str) -> str | None:
+    """
+    Guess a mimetype from a file extension (e.g., ".html"). Results are cached.
+    """
+    mimetype, _ = mimetypes.guess_type("placeholder" + extension, strict=False)
+    return mimetype
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_extension_from_mimetype(mimetype: str) -> str | None:
+    """
+    Guess a file extension from a mimetype, returning the first candidate. Results are cached.
+    """
+    extensions = mimetypes.guess_all_extensions(mimetype, strict=False)
+    return extensions[0] if len(extensions) > 0 else None
+
+
+def _is_utf8(data: bytes) -> bool:
+    """Return True if the given bytes decode cleanly as UTF-8."""
+    try:
+        data.decode("utf-8")
+        return True
+    except UnicodeDecodeError:
+        return False
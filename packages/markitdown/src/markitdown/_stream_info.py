@@ -1,8 +1,8 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, replace
 from typing import Optional
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class StreamInfo:
     """The StreamInfo class is used to store information about a file stream.
     All fields can be None, and will depend on how the stream was opened.
@@ -20,13 +20,20 @@ class StreamInfo:
     def copy_and_update(self, *args, **kwargs):
         """Copy the StreamInfo object and update it with the given StreamInfo
         instance and/or other keyword arguments."""
-        new_info = asdict(self)
+        updates = {}
 
         for si in args:
             assert isinstance(si, StreamInfo)
-            new_info.update({k: v for k, v in asdict(si).items() if v is not None})
+            for name in _FIELDS:
+                v = getattr(si, name)
+                if v is not None:
+                    updates[name] = v
 
         if len(kwargs) > 0:
-            new_info.update(kwargs)
+            updates.update(kwargs)
 
-        return StreamInfo(**new_info)
+        return replace(self, **updates)
+
+
+# Names of the StreamInfo fields, in declaration order
+_FIELDS = tuple(f.name for f in fields(StreamInfo))
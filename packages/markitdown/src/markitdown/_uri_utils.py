@@ -1,4 +1,4 @@
-import base64
+import binascii
 import os
 from typing import Tuple, Dict
 from urllib.request import url2pathname
@@ -47,6 +47,8 @@ def parse_data_uri(uri: str) -> Tuple[str | None, Dict[str, str], bytes]:
         elif len(part) > 0:
             attributes[part] = ""
 
-    content = base64.b64decode(data) if is_base64 else unquote_to_bytes(data)
+    # binascii reads an ASCII str in place, where base64.b64decode would first
+    # encode a full copy of it to bytes
+    content = binascii.a2b_base64(data) if is_base64 else unquote_to_bytes(data)
 
     return mime_type, attributes, content
@@ -2,27 +2,56 @@
 #
 # SPDX-License-Identifier: MIT
 
-from ._plain_text_converter import PlainTextConverter
-from ._html_converter import HtmlConverter
-from ._rss_converter import RssConverter
-from ._wikipedia_converter import WikipediaConverter
-from ._youtube_converter import YouTubeConverter
-from ._ipynb_converter import IpynbConverter
-from ._bing_serp_converter import BingSerpConverter
-from ._pdf_converter import PdfConverter
-from ._docx_converter import DocxConverter
-from ._xlsx_converter import XlsxConverter, XlsConverter
-from ._pptx_converter import PptxConverter
-from ._image_converter import ImageConverter
-from ._audio_converter import AudioConverter
-from ._outlook_msg_converter import OutlookMsgConverter
-from ._zip_converter import ZipConverter
-from ._doc_intel_converter import (
-    DocumentIntelligenceConverter,
-    DocumentIntelligenceFileType,
-)
-from ._epub_converter import EpubConverter
-from ._csv_converter import CsvConverter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Converters are imported on first access (PEP 562), so that importing the
+# package doesn't pull in every optional dependency up front.
+_LAZY_IMPORTS = {
+    "PlainTextConverter": "._plain_text_converter",
+    "HtmlConverter": "._html_converter",
+    "RssConverter": "._rss_converter",
+    "WikipediaConverter": "._wikipedia_converter",
+    "YouTubeConverter": "._youtube_converter",
+    "IpynbConverter": "._ipynb_converter",
+    "BingSerpConverter": "._bing_serp_converter",
+    "PdfConverter": "._pdf_converter",
+    "DocxConverter": "._docx_converter",
+    "XlsxConverter": "._xlsx_converter",
+    "XlsConverter": "._xlsx_converter",
+    "PptxConverter": "._pptx_converter",
+    "ImageConverter": "._image_converter",
+    "AudioConverter": "._audio_converter",
+    "OutlookMsgConverter": "._outlook_msg_converter",
+    "ZipConverter": "._zip_converter",
+    "DocumentIntelligenceConverter": "._doc_intel_converter",
+    "DocumentIntelligenceFileType": "._doc_intel_converter",
+    "EpubConverter": "._epub_converter",
+    "CsvConverter": "._csv_converter",
+}
+
+if TYPE_CHECKING:
+    from ._plain_text_converter import PlainTextConverter
+    from ._html_converter import HtmlConverter
+    from ._rss_converter import RssConverter
+    from ._wikipedia_converter import WikipediaConverter
+    from ._youtube_converter import YouTubeConverter
+    from ._ipynb_converter import IpynbConverter
+    from ._bing_serp_converter import BingSerpConverter
+    from ._pdf_converter import PdfConverter
+    from ._docx_converter import DocxConverter
+    from ._xlsx_converter import XlsxConverter, XlsConverter
+    from ._pptx_converter import PptxConverter
+    from ._image_converter import ImageConverter
+    from ._audio_converter import AudioConverter
+    from ._outlook_msg_converter import OutlookMsgConverter
+    from ._zip_converter import ZipConverter
+    from ._doc_intel_converter import (
+        DocumentIntelligenceConverter,
+        DocumentIntelligenceFileType,
+    )
+    from ._epub_converter import EpubConverter
+    from ._csv_converter import CsvConverter
 
 __all__ = [
     "PlainTextConverter",
@@ -46,3 +75,16 @@ __all__ = [
     "EpubConverter",
     "CsvConverter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache, so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -6,18 +6,26 @@ from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "audio/x-wav",
     "audio/mpeg",
     "video/mp4",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [
-    ".wav",
-    ".mp3",
-    ".m4a",
-    ".mp4",
-]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".mp4"})
+
+# Audio format to pass to the transcriber, by extension or mimetype
+_EXTENSION_TO_AUDIO_FORMAT = {
+    ".wav": "wav",
+    ".mp3": "mp3",
+    ".mp4": "mp4",
+    ".m4a": "mp4",
+}
+_MIMETYPE_TO_AUDIO_FORMAT = {
+    "audio/x-wav": "wav",
+    "audio/mpeg": "mp3",
+    "video/mp4": "mp4",
+}
 
 
 class AudioConverter(DocumentConverter):
@@ -37,11 +45,7 @@ class AudioConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -76,17 +80,9 @@ class AudioConverter(DocumentConverter):
                     md_content += f"{f}: {metadata[f]}\n"
 
         # Figure out the audio format for transcription
-        if stream_info.extension == ".wav" or stream_info.mimetype == "audio/x-wav":
-            audio_format = "wav"
-        elif stream_info.extension == ".mp3" or stream_info.mimetype == "audio/mpeg":
-            audio_format = "mp3"
-        elif (
-            stream_info.extension in [".mp4", ".m4a"]
-            or stream_info.mimetype == "video/mp4"
-        ):
-            audio_format = "mp4"
-        else:
-            audio_format = None
+        audio_format = _EXTENSION_TO_AUDIO_FORMAT.get(
+            stream_info.extension or ""
+        ) or _MIMETYPE_TO_AUDIO_FORMAT.get(stream_info.mimetype or "")
 
         # Transcribe
         if audio_format:
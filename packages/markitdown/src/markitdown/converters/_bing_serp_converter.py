@@ -1,23 +1,25 @@
 import re
-import base64
 import binascii
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, urlparse, unquote_plus
 from typing import Any, BinaryIO
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from ._markdownify import _CustomMarkdownify
+from ._html_converter import _HTML_PARSER
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "text/html",
     "application/xhtml",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [
-    ".html",
-    ".htm",
-]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".html", ".htm"})
+
+_BING_URL_RE = re.compile(r"https://www\.bing\.com/search\?q=")
+_NEWLINES_RE = re.compile(r"\n+")
+_REDIRECT_PARAM_RE = re.compile(r"[?&]u=([^&#]+)")
+_BASE64URL_TO_BASE64 = bytes.maketrans(b"-_", b"+/")
 
 
 class BingSerpConverter(DocumentConverter):
@@ -40,16 +42,15 @@ class BingSerpConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if not re.search(r"^https://www\.bing\.com/search\?q=", url):
+        if not _BING_URL_RE.match(url):
             # Not a Bing SERP URL
             return False
 
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES):
+            return True
 
         # Not HTML content
         return False
@@ -66,9 +67,15 @@ class BingSerpConverter(DocumentConverter):
         parsed_params = parse_qs(urlparse(stream_info.url).query)
         query = parsed_params.get("q", [""])[0]
 
-        # Parse the stream
+        # Parse the stream. Only the page title and the results list (an <ol>)
+        # are used, so skip building a tree for the rest of the page.
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        soup = BeautifulSoup(
+            file_stream,
+            _HTML_PARSER,
+            from_encoding=encoding,
+            parse_only=SoupStrainer(["title", "ol"]),
+        )
 
         # Clean up some formatting
         for tptt in soup.find_all(class_="tptt"):
@@ -86,27 +93,26 @@ class BingSerpConverter(DocumentConverter):
 
             # Rewrite redirect urls
             for a in result.find_all("a", href=True):
-                parsed_href = urlparse(a["href"])
-                qs = parse_qs(parsed_href.query)
-
                 # The destination is contained in the u parameter,
                 # but appears to be base64 encoded, with some prefix
-                if "u" in qs:
+                m = _REDIRECT_PARAM_RE.search(a["href"])
+                if m:
                     u = (
-                        qs["u"][0][2:].strip() + "=="
+                        unquote_plus(m.group(1))[2:].strip() + "=="
                     )  # Python 3 doesn't care about extra padding
 
                     try:
                         # RFC 4648 / Base64URL" variant, which uses "-" and "_"
-                        a["href"] = base64.b64decode(u, altchars="-_").decode("utf-8")
-                    except UnicodeDecodeError:
+                        u_bytes = u.encode("ascii").translate(_BASE64URL_TO_BASE64)
+                        a["href"] = binascii.a2b_base64(u_bytes).decode("utf-8")
+                    except UnicodeError:
                         pass
                     except binascii.Error:
                         pass
 
             # Convert to markdown
             md_result = _markdownify.convert_soup(result).strip()
-            lines = [line.strip() for line in re.split(r"\n+", md_result)]
+            lines = [line.strip() for line in _NEWLINES_RE.split(md_result)]
             results.append("\n".join([line for line in lines if len(line) > 0]))
 
         webpage_text = (
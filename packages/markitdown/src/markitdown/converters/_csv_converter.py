@@ -1,3 +1,4 @@
+import codecs
 import csv
 import io
 from typing import BinaryIO, Any
@@ -5,11 +6,14 @@ from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "text/csv",
     "application/csv",
-]
-ACCEPTED_FILE_EXTENSIONS = [".csv"]
+)
+ACCEPTED_FILE_EXTENSIONS = frozenset({".csv"})
+
+# Number of leading bytes used to guess the charset, when it isn't known
+CHARSET_DETECTION_SAMPLE_SIZE = 64 * 1024
 
 
 class CsvConverter(DocumentConverter):
@@ -30,9 +34,8 @@ class CsvConverter(DocumentConverter):
         extension = (stream_info.extension or "").lower()
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES):
+            return True
         return False
 
     def convert(
@@ -41,37 +44,79 @@ class CsvConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Read the file content
-        if stream_info.charset:
-            content = file_stream.read().decode(stream_info.charset)
-        else:
-            content = str(from_bytes(file_stream.read()).best())
+        # Work out the encoding. If it isn't known, guess it from a leading
+        # sample rather than running detection over the whole file.
+        encoding = stream_info.charset
+        errors = "strict"
+        if not encoding:
+            cur_pos = file_stream.tell()
+            sample = file_stream.read(CHARSET_DETECTION_SAMPLE_SIZE)
+            file_stream.seek(cur_pos)
+
+            if sample.startswith(codecs.BOM_UTF8):
+                encoding = "utf-8-sig"
+            elif b"\x00" not in sample and _is_utf8(sample):
+                # Most CSV is UTF-8 (or ASCII), which a strict decode confirms
+                encoding = "utf-8"
+            else:
+                best_guess = from_bytes(sample).best()
+                if best_guess is None or best_guess.encoding == "ascii":
+                    # An ASCII sample says nothing about the rest of the file
+                    encoding = "utf-8"
+                else:
+                    encoding = best_guess.encoding
+
+            # The guess only saw a sample, so don't fail on bytes it didn't see
+            errors = "replace"
 
-        # Parse CSV content
-        reader = csv.reader(io.StringIO(content))
-        rows = list(reader)
+        # Decode and parse the CSV content as a stream
+        text_stream = io.TextIOWrapper(
+            file_stream, encoding=encoding, errors=errors, newline=""
+        )
+        try:
+            reader = csv.reader(text_stream)
+            header = next(reader, None)
 
-        if not rows:
-            return DocumentConverterResult(markdown="")
+            if header is None:
+                return DocumentConverterResult(markdown="")
 
-        # Create markdown table
-        markdown_table = []
+            num_columns = len(header)
 
-        # Add header row
-        markdown_table.append("| " + " | ".join(rows[0]) + " |")
+            # Create markdown table
+            markdown_table = []
 
-        # Add separator row
-        markdown_table.append("| " + " | ".join(["---"] * len(rows[0])) + " |")
+            # Add header row
+            markdown_table.append("| " + " | ".join(header) + " |")
 
-        # Add data rows
-        for row in rows[1:]:
-            # Make sure row has the same number of columns as header
-            while len(row) < len(rows[0]):
-                row.append("")
-            # Truncate if row has more columns than header
-            row = row[: len(rows[0])]
-            markdown_table.append("| " + " | ".join(row) + " |")
+            # Add separator row
+            markdown_table.append("| " + " | ".join(["---"] * num_columns) + " |")
+
+            # Add data rows as they are parsed. Bind the hot methods to locals,
+            # since this loop runs once per row.
+            append = markdown_table.append
+            join = " | ".join
+            for row in reader:
+                row_len = len(row)
+                # Make sure row has the same number of columns as header
+                if row_len < num_columns:
+                    row.extend([""] * (num_columns - row_len))
+                # Truncate if row has more columns than header
+                elif row_len > num_columns:
+                    row = row[:num_columns]
+                append(f"| {join(row)} |")
+        finally:
+            # Detach, so that the wrapper doesn't close the underlying stream
+            text_stream.detach()
 
         result = "\n".join(markdown_table)
 
         return DocumentConverterResult(markdown=result)
+
+
+def _is_utf8(sample: bytes) -> bool:
+    """Check that a sample is valid UTF-8, ignoring a character cut off at its end."""
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
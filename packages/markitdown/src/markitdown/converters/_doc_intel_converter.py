@@ -1,7 +1,10 @@
 import sys
+import io
 import re
 import os
-from typing import BinaryIO, Any, List
+import hashlib
+import threading
+from typing import BinaryIO, Any, Dict, List, Tuple
 from enum import Enum
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
@@ -14,7 +17,6 @@ _dependency_exc_info = None
 try:
     from azure.ai.documentintelligence import DocumentIntelligenceClient
     from azure.ai.documentintelligence.models import (
-        AnalyzeDocumentRequest,
         AnalyzeResult,
         DocumentAnalysisFeature,
     )
@@ -34,9 +36,6 @@ except ImportError:
     class DocumentIntelligenceClient:
         pass
 
-    class AnalyzeDocumentRequest:
-        pass
-
     class AnalyzeResult:
         pass
 
@@ -51,6 +50,8 @@ except ImportError:
 # This constant is a temporary fix until the bug is resolved.
 CONTENT_FORMAT = "markdown"
 
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
 
 class DocumentIntelligenceFileType(str, Enum):
     """Enum of file types supported by the Document Intelligence Converter."""
@@ -68,58 +69,102 @@ class DocumentIntelligenceFileType(str, Enum):
     TIFF = "tiff"
 
 
+# The (file extensions, MIME type prefixes) handled for each file type
+_FILE_TYPE_TABLE = {
+    DocumentIntelligenceFileType.DOCX: (
+        (".docx",),
+        ("application/vnd.openxmlformats-officedocument.wordprocessingml.document",),
+    ),
+    DocumentIntelligenceFileType.PPTX: (
+        (".pptx",),
+        ("application/vnd.openxmlformats-officedocument.presentationml",),
+    ),
+    DocumentIntelligenceFileType.XLSX: (
+        (".xlsx",),
+        ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",),
+    ),
+    DocumentIntelligenceFileType.HTML: ((), ()),
+    DocumentIntelligenceFileType.PDF: (
+        (".pdf",),
+        ("application/pdf", "application/x-pdf"),
+    ),
+    DocumentIntelligenceFileType.JPEG: ((".jpg", ".jpeg"), ("image/jpeg",)),
+    DocumentIntelligenceFileType.PNG: ((".png",), ("image/png",)),
+    DocumentIntelligenceFileType.BMP: ((".bmp",), ("image/bmp",)),
+    DocumentIntelligenceFileType.TIFF: ((".tiff",), ("image/tiff",)),
+}
+
+
 def _get_mime_type_prefixes(types: List[DocumentIntelligenceFileType]) -> List[str]:
     """Get the MIME type prefixes for the given file types."""
-    prefixes: List[str] = []
-    for type_ in types:
-        if type_ == DocumentIntelligenceFileType.DOCX:
-            prefixes.append(
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            )
-        elif type_ == DocumentIntelligenceFileType.PPTX:
-            prefixes.append(
-                "application/vnd.openxmlformats-officedocument.presentationml"
-            )
-        elif type_ == DocumentIntelligenceFileType.XLSX:
-            prefixes.append(
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
-        elif type_ == DocumentIntelligenceFileType.PDF:
-            prefixes.append("application/pdf")
-            prefixes.append("application/x-pdf")
-        elif type_ == DocumentIntelligenceFileType.JPEG:
-            prefixes.append("image/jpeg")
-        elif type_ == DocumentIntelligenceFileType.PNG:
-            prefixes.append("image/png")
-        elif type_ == DocumentIntelligenceFileType.BMP:
-            prefixes.append("image/bmp")
-        elif type_ == DocumentIntelligenceFileType.TIFF:
-            prefixes.append("image/tiff")
-    return prefixes
+    return [prefix for type_ in types for prefix in _FILE_TYPE_TABLE[type_][1]]
 
 
 def _get_file_extensions(types: List[DocumentIntelligenceFileType]) -> List[str]:
     """Get the file extensions for the given file types."""
-    extensions: List[str] = []
-    for type_ in types:
-        if type_ == DocumentIntelligenceFileType.DOCX:
-            extensions.append(".docx")
-        elif type_ == DocumentIntelligenceFileType.PPTX:
-            extensions.append(".pptx")
-        elif type_ == DocumentIntelligenceFileType.XLSX:
-            extensions.append(".xlsx")
-        elif type_ == DocumentIntelligenceFileType.PDF:
-            extensions.append(".pdf")
-        elif type_ == DocumentIntelligenceFileType.JPEG:
-            extensions.append(".jpg")
-            extensions.append(".jpeg")
-        elif type_ == DocumentIntelligenceFileType.PNG:
-            extensions.append(".png")
-        elif type_ == DocumentIntelligenceFileType.BMP:
-            extensions.append(".bmp")
-        elif type_ == DocumentIntelligenceFileType.TIFF:
-            extensions.append(".tiff")
-    return extensions
+    return [extension for type_ in types for extension in _FILE_TYPE_TABLE[type_][0]]
+
+
+# Types that don't support ocr
+_NO_OCR_TYPES = [
+    DocumentIntelligenceFileType.DOCX,
+    DocumentIntelligenceFileType.PPTX,
+    DocumentIntelligenceFileType.XLSX,
+    DocumentIntelligenceFileType.HTML,
+]
+_NO_OCR_FILE_EXTENSIONS = frozenset(_get_file_extensions(_NO_OCR_TYPES))
+_NO_OCR_MIME_TYPE_PREFIXES = tuple(_get_mime_type_prefixes(_NO_OCR_TYPES))
+
+
+# Clients are shared between converter instances, so that they also share a
+# connection pool. Maps (endpoint, api_version, credential key) to the
+# (credential, client) pair, oldest first.
+_CLIENT_CACHE_SIZE = 16
+_clients: Dict[Tuple[str, str, Any], Tuple[Any, DocumentIntelligenceClient]] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(
+    *,
+    endpoint: str,
+    api_version: str,
+    credential: AzureKeyCredential | TokenCredential | None,
+    api_key: str | None,
+) -> DocumentIntelligenceClient:
+    """Get a (possibly shared) client for the given endpoint and credential."""
+    if credential is not None:
+        # Credentials needn't be hashable, so key on their identity. The cache
+        # entry holds a reference to the credential, so its id can't be reused.
+        credential_key: Any = ("credential", id(credential))
+    elif api_key is not None:
+        # Don't keep the secret itself around in the key
+        credential_key = ("api_key", hashlib.sha256(api_key.encode()).hexdigest())
+    else:
+        credential_key = None
+    key = (endpoint, api_version, credential_key)
+
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry is not None:
+            return entry[1]
+
+        client_credential = credential
+        if client_credential is None:
+            if api_key is None:
+                client_credential = DefaultAzureCredential()
+            else:
+                client_credential = AzureKeyCredential(api_key)
+
+        client = DocumentIntelligenceClient(
+            endpoint=endpoint,
+            api_version=api_version,
+            credential=client_credential,
+        )
+
+        if len(_clients) >= _CLIENT_CACHE_SIZE:
+            del _clients[next(iter(_clients))]
+        _clients[key] = (credential, client)
+        return client
 
 
 class DocumentIntelligenceConverter(DocumentConverter):
@@ -154,6 +199,8 @@ class DocumentIntelligenceConverter(DocumentConverter):
 
         super().__init__()
         self._file_types = file_types
+        self._accepted_file_extensions = frozenset(_get_file_extensions(file_types))
+        self._accepted_mime_type_prefixes = tuple(_get_mime_type_prefixes(file_types))
 
         # Raise an error if the dependencies are not available.
         # This is different than other converters since this one isn't even instantiated
@@ -167,18 +214,13 @@ class DocumentIntelligenceConverter(DocumentConverter):
                 _dependency_exc_info[2]
             )
 
-        if credential is None:
-            if os.environ.get("AZURE_API_KEY") is None:
-                credential = DefaultAzureCredential()
-            else:
-                credential = AzureKeyCredential(os.environ["AZURE_API_KEY"])
-
         self.endpoint = endpoint
         self.api_version = api_version
-        self.doc_intel_client = DocumentIntelligenceClient(
+        self.doc_intel_client = _get_client(
             endpoint=self.endpoint,
             api_version=self.api_version,
             credential=credential,
+            api_key=os.environ.get("AZURE_API_KEY") if credential is None else None,
         )
 
     def accepts(
@@ -190,14 +232,10 @@ class DocumentIntelligenceConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if extension in _get_file_extensions(self._file_types):
+        if extension in self._accepted_file_extensions:
             return True
 
-        for prefix in _get_mime_type_prefixes(self._file_types):
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(self._accepted_mime_type_prefixes)
 
     def _analysis_features(self, stream_info: StreamInfo) -> List[str]:
         """
@@ -208,20 +246,11 @@ class DocumentIntelligenceConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        # Types that don't support ocr
-        no_ocr_types = [
-            DocumentIntelligenceFileType.DOCX,
-            DocumentIntelligenceFileType.PPTX,
-            DocumentIntelligenceFileType.XLSX,
-            DocumentIntelligenceFileType.HTML,
-        ]
-
-        if extension in _get_file_extensions(no_ocr_types):
+        if extension in _NO_OCR_FILE_EXTENSIONS:
             return []
 
-        for prefix in _get_mime_type_prefixes(no_ocr_types):
-            if mimetype.startswith(prefix):
-                return []
+        if mimetype.startswith(_NO_OCR_MIME_TYPE_PREFIXES):
+            return []
 
         return [
             DocumentAnalysisFeature.FORMULAS,  # enable formula extraction
@@ -235,15 +264,22 @@ class DocumentIntelligenceConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        # Upload the raw document, rather than a base64-encoded JSON request.
+        # File objects are streamed by the transport, not read into memory.
+        body = file_stream if isinstance(file_stream, io.IOBase) else file_stream.read()
+
         # Extract the text using Azure Document Intelligence
         poller = self.doc_intel_client.begin_analyze_document(
             model_id="prebuilt-layout",
-            body=AnalyzeDocumentRequest(bytes_source=file_stream.read()),
+            body=body,
+            content_type="application/octet-stream",
             features=self._analysis_features(stream_info),
             output_content_format=CONTENT_FORMAT,  # TODO: replace with "ContentFormat.MARKDOWN" when the bug is fixed
         )
         result: AnalyzeResult = poller.result()
 
         # remove comments from the markdown content generated by Doc Intelligence and append to markdown string
-        markdown_text = re.sub(r"<!--.*?-->", "", result.content, flags=re.DOTALL)
+        markdown_text = result.content
+        if "<!--" in markdown_text:
+            markdown_text = _COMMENT_RE.sub("", markdown_text)
         return DocumentConverterResult(markdown=markdown_text)
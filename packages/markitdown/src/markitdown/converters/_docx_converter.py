@@ -1,5 +1,3 @@
-import sys
-
 from typing import BinaryIO, Any
 
 from ._html_converter import HtmlConverter
@@ -8,21 +6,25 @@ from .._base_converter import DocumentConverterResult
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    import mammoth
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+# mammoth is an optional (but in this case, required) dependency. It is slow
+# to import, so it is only loaded once a DOCX file is actually converted.
+_mammoth = None
+
+
+def _import_mammoth():
+    global _mammoth
+    if _mammoth is None:
+        import mammoth
 
+        _mammoth = mammoth
+    return _mammoth
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [".docx"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".docx"})
 
 
 class DocxConverter(HtmlConverter):
@@ -46,11 +48,7 @@ class DocxConverter(HtmlConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -59,18 +57,16 @@ class DocxConverter(HtmlConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         # Check: the dependencies
-        if _dependency_exc_info is not None:
+        try:
+            mammoth = _import_mammoth()
+        except ImportError as e:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
                     converter=type(self).__name__,
                     extension=".docx",
                     feature="docx",
                 )
-            ) from _dependency_exc_info[
-                1
-            ].with_traceback(  # type: ignore[union-attr]
-                _dependency_exc_info[2]
-            )
+            ) from e
 
         style_map = kwargs.get("style_map", None)
         pre_process_stream = pre_process_docx(file_stream)
@@ -1,7 +1,6 @@
 import os
 import zipfile
-from defusedxml import minidom
-from xml.dom.minidom import Document
+from defusedxml import ElementTree
 
 from typing import BinaryIO, Any, Dict, List
 
@@ -9,13 +8,15 @@ from ._html_converter import HtmlConverter
 from .._base_converter import DocumentConverterResult
 from .._stream_info import StreamInfo
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "application/epub",
     "application/epub+zip",
     "application/x-epub+zip",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [".epub"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".epub"})
+
+DC_NAMESPACE = "{http://purl.org/dc/elements/1.1/}"
 
 MIME_TYPE_MAPPING = {
     ".html": "text/html",
@@ -44,11 +45,7 @@ class EpubConverter(HtmlConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -60,32 +57,40 @@ class EpubConverter(HtmlConverter):
             # Extracts metadata (title, authors, language, publisher, date, description, cover) from an EPUB file."""
 
             # Locate content.opf
-            container_dom = minidom.parse(z.open("META-INF/container.xml"))
-            opf_path = container_dom.getElementsByTagName("rootfile")[0].getAttribute(
-                "full-path"
-            )
+            container_root = ElementTree.parse(z.open("META-INF/container.xml"))
+            opf_path = container_root.findall(".//{*}rootfile")[0].get("full-path", "")
 
             # Parse content.opf
-            opf_dom = minidom.parse(z.open(opf_path))
+            opf_root = ElementTree.parse(z.open(opf_path)).getroot()
+
+            # Collect the Dublin Core fields (dc:title, etc.) in a single pass
+            dc_texts: Dict[str, List[str]] = {}
+            metadata_root = opf_root.find("{*}metadata")
+            for node in (opf_root if metadata_root is None else metadata_root).iter():
+                if node.tag.startswith(DC_NAMESPACE) and node.text is not None:
+                    dc_name = node.tag[len(DC_NAMESPACE) :]
+                    dc_texts.setdefault(dc_name, []).append(node.text.strip())
+
             metadata: Dict[str, Any] = {
-                "title": self._get_text_from_node(opf_dom, "dc:title"),
-                "authors": self._get_all_texts_from_nodes(opf_dom, "dc:creator"),
-                "language": self._get_text_from_node(opf_dom, "dc:language"),
-                "publisher": self._get_text_from_node(opf_dom, "dc:publisher"),
-                "date": self._get_text_from_node(opf_dom, "dc:date"),
-                "description": self._get_text_from_node(opf_dom, "dc:description"),
-                "identifier": self._get_text_from_node(opf_dom, "dc:identifier"),
+                "title": dc_texts.get("title", [None])[0],
+                "authors": dc_texts.get("creator", []),
+                "language": dc_texts.get("language", [None])[0],
+                "publisher": dc_texts.get("publisher", [None])[0],
+                "date": dc_texts.get("date", [None])[0],
+                "description": dc_texts.get("description", [None])[0],
+                "identifier": dc_texts.get("identifier", [None])[0],
             }
 
             # Extract manifest items (ID → href mapping)
             manifest = {
-                item.getAttribute("id"): item.getAttribute("href")
-                for item in opf_dom.getElementsByTagName("item")
+                item.get("id", ""): item.get("href", "")
+                for item in opf_root.iterfind(".//{*}item")
             }
 
             # Extract spine order (ID refs)
-            spine_items = opf_dom.getElementsByTagName("itemref")
-            spine_order = [item.getAttribute("idref") for item in spine_items]
+            spine_order = [
+                item.get("idref", "") for item in opf_root.iterfind(".//{*}itemref")
+            ]
 
             # Convert spine order to actual file paths
             base_path = "/".join(
@@ -99,8 +104,9 @@ class EpubConverter(HtmlConverter):
 
             # Extract and convert the content
             markdown_content: List[str] = []
+            archive_files = set(z.namelist())
             for file in spine:
-                if file in z.namelist():
+                if file in archive_files:
                     with z.open(file) as f:
                         filename = os.path.basename(file)
                         extension = os.path.splitext(filename)[1].lower()
@@ -128,19 +134,3 @@ class EpubConverter(HtmlConverter):
             return DocumentConverterResult(
                 markdown="\n\n".join(markdown_content), title=metadata["title"]
             )
-
-    def _get_text_from_node(self, dom: Document, tag_name: str) -> str | None:
-        """Convenience function to extract a single occurrence of a tag (e.g., title)."""
-        texts = self._get_all_texts_from_nodes(dom, tag_name)
-        if len(texts) > 0:
-            return texts[0]
-        else:
-            return None
-
-    def _get_all_texts_from_nodes(self, dom: Document, tag_name: str) -> List[str]:
-        """Helper function to extract all occurrences of a tag (e.g., multiple authors)."""
-        texts: List[str] = []
-        for node in dom.getElementsByTagName(tag_name):
-            if node.firstChild and hasattr(node.firstChild, "nodeValue"):
-                texts.append(node.firstChild.nodeValue.strip())
-        return texts
@@ -1,7 +1,161 @@
+import atexit
 import json
+import os
 import subprocess
 import locale
-from typing import BinaryIO, Any, Union
+import tempfile
+import threading
+import time
+from typing import BinaryIO, Any, Dict, Union
+
+# Seconds to wait for exiftool to answer a single request. A hung request
+# would otherwise block metadata extraction for every other conversion.
+EXIFTOOL_TIMEOUT = 30
+
+
+class _ExiftoolProcess:
+    """
+    A long-running `exiftool -stay_open` process. Starting exiftool (a Perl
+    program) dominates the cost of reading metadata from small files, so one
+    process is kept per exiftool path and fed requests over stdin.
+    """
+
+    def __init__(self, exiftool_path: str):
+        self._lock = threading.Lock()
+        self._process = subprocess.Popen(
+            [exiftool_path, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+        # A single watchdog thread kills the process if the current request
+        # isn't answered by its deadline. That ends the readline() in
+        # execute(), and the process is restarted on next use.
+        self._watchdog_cond = threading.Condition()
+        self._deadline: Union[float, None] = None
+        self._timed_out = False
+        self._closed = False
+        threading.Thread(target=self._watchdog, daemon=True).start()
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def execute(self, *args: str) -> bytes:
+        """Run exiftool with the given arguments (one per line), and return its stdout."""
+        assert self._process.stdin is not None
+        assert self._process.stdout is not None
+
+        with self._lock:
+            with self._watchdog_cond:
+                self._deadline = time.monotonic() + EXIFTOOL_TIMEOUT
+                self._watchdog_cond.notify()
+            try:
+                self._process.stdin.write(
+                    "".join(f"{arg}\n" for arg in args + ("-execute",)).encode("utf-8")
+                )
+                self._process.stdin.flush()
+
+                # Output is terminated by a "{ready}" line
+                output = []
+                while True:
+                    line = self._process.stdout.readline()
+                    if not line:
+                        break
+                    if line.rstrip() == b"{ready}":
+                        return b"".join(output)
+                    output.append(line)
+            finally:
+                with self._watchdog_cond:
+                    self._deadline = None
+
+            if self._timed_out:
+                self._process.wait()
+                raise subprocess.TimeoutExpired(self._process.args, EXIFTOOL_TIMEOUT)
+            raise OSError("exiftool exited unexpectedly")
+
+    def _watchdog(self) -> None:
+        with self._watchdog_cond:
+            while not self._closed:
+                if self._deadline is None:
+                    self._watchdog_cond.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._watchdog_cond.wait(remaining)
+                    continue
+                self._timed_out = True
+                self._process.kill()
+                return
+
+    def close(self) -> None:
+        with self._watchdog_cond:
+            self._closed = True
+            self._watchdog_cond.notify()
+        try:
+            assert self._process.stdin is not None
+            self._process.stdin.write(b"-stay_open\nFalse\n")
+            self._process.stdin.flush()
+            self._process.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self._process.kill()
+
+
+_processes: Dict[str, _ExiftoolProcess] = {}
+_processes_lock = threading.Lock()
+
+
+@atexit.register
+def _close_processes() -> None:
+    with _processes_lock:
+        for process in _processes.values():
+            process.close()
+        _processes.clear()
+
+
+def _get_process(exiftool_path: str) -> _ExiftoolProcess:
+    with _processes_lock:
+        process = _processes.get(exiftool_path)
+        if process is None or not process.alive:
+            if process is not None:
+                process.close()
+            process = _ExiftoolProcess(exiftool_path)
+            _processes[exiftool_path] = process
+        return process
+
+
+def _local_path(file_stream: BinaryIO) -> Union[str, None]:
+    """Return the path of the local file the stream reads from its start, if any."""
+    name = getattr(file_stream, "name", None)
+    # Arguments are sent one per line, so the path must be a single line
+    if not isinstance(name, str) or not name.isprintable():
+        return None
+    if file_stream.tell() != 0 or not os.path.isfile(name):
+        return None
+    # An absolute path can't be mistaken for an option
+    return os.path.abspath(name)
+
+
+def _run_stay_open(exiftool_path: str, file_stream: BinaryIO) -> bytes:
+    # Pass a plain local file to exiftool by its path
+    local_path = _local_path(file_stream)
+    if local_path is not None:
+        return _get_process(exiftool_path).execute(
+            "-json", "-charset", "filename=utf8", local_path
+        )
+
+    # Arguments are read from stdin in this mode, so the file can't also be
+    # piped in. Hand it over through a temporary file instead.
+    fd, temp_path = tempfile.mkstemp(prefix="markitdown-exiftool-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(file_stream.read())
+        return _get_process(exiftool_path).execute(
+            "-json", "-charset", "filename=utf8", temp_path
+        )
+    finally:
+        os.unlink(temp_path)
 
 
 def exiftool_metadata(
@@ -9,6 +163,12 @@ def exiftool_metadata(
     *,
     exiftool_path: Union[str, None],
 ) -> Any:  # Need a better type for json data
+    """
+    Read the metadata of the stream with exiftool. Raises
+    subprocess.TimeoutExpired if exiftool doesn't answer within
+    EXIFTOOL_TIMEOUT seconds. The request isn't retried, since the same file
+    would likely hang exiftool again.
+    """
     # Nothing to do
     if not exiftool_path:
         return {}
@@ -16,15 +176,26 @@ def exiftool_metadata(
     # Run exiftool
     cur_pos = file_stream.tell()
     try:
-        output = subprocess.run(
-            [exiftool_path, "-json", "-"],
-            input=file_stream.read(),
-            capture_output=True,
-            text=False,
-        ).stdout
-
-        return json.loads(
-            output.decode(locale.getpreferredencoding(False)),
-        )[0]
+        try:
+            output = _run_stay_open(exiftool_path, file_stream)
+        except OSError:
+            # Fall back to a one-off exiftool process
+            file_stream.seek(cur_pos)
+            output = subprocess.run(
+                [exiftool_path, "-json", "-"],
+                input=file_stream.read(),
+                capture_output=True,
+                text=False,
+                timeout=EXIFTOOL_TIMEOUT,
+            ).stdout
+
+        # exiftool writes JSON as UTF-8, which json.loads decodes from bytes
+        try:
+            metadata = json.loads(output)
+        except UnicodeDecodeError:
+            metadata = json.loads(
+                output.decode(locale.getpreferredencoding(False), errors="replace")
+            )
+        return metadata[0]
     finally:
         file_stream.seek(cur_pos)
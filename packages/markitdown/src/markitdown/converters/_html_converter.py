@@ -6,15 +6,20 @@ from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from ._markdownify import _CustomMarkdownify
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+# Prefer the (much faster) lxml parser when it is available
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "text/html",
     "application/xhtml",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [
-    ".html",
-    ".htm",
-]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".html", ".htm"})
 
 
 class HtmlConverter(DocumentConverter):
@@ -32,11 +37,7 @@ class HtmlConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -44,9 +45,20 @@ class HtmlConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Parse the stream
+        # Nothing to parse (e.g., an empty EPUB chapter stub)
+        html_content = file_stream.read()
+        if not html_content or html_content.isspace():
+            return DocumentConverterResult(markdown="")
+
+        # Parse the stream. lxml warns about every document that starts with an
+        # XML declaration (e.g., XHTML EPUB chapters), which are parsed as HTML
+        # on purpose. Leading whitespace avoids the warning, without changing
+        # the process-wide (and thread-unsafe) warnings filters.
+        if html_content.startswith(b"<?xml"):
+            html_content = b"\n" + html_content
+
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        soup = BeautifulSoup(html_content, _HTML_PARSER, from_encoding=encoding)
 
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
@@ -54,11 +66,9 @@ class HtmlConverter(DocumentConverter):
 
         # Print only the main content
         body_elm = soup.find("body")
-        webpage_text = ""
-        if body_elm:
-            webpage_text = _CustomMarkdownify(**kwargs).convert_soup(body_elm)
-        else:
-            webpage_text = _CustomMarkdownify(**kwargs).convert_soup(soup)
+        webpage_text = _CustomMarkdownify(**kwargs).convert_soup(
+            body_elm if body_elm else soup
+        )
 
         assert isinstance(webpage_text, str)
 
@@ -5,12 +5,12 @@ from ._exiftool import exiftool_metadata
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "image/jpeg",
     "image/png",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [".jpg", ".jpeg", ".png"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
 
 
 class ImageConverter(DocumentConverter):
@@ -30,11 +30,7 @@ class ImageConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
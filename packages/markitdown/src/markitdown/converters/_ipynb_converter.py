@@ -1,15 +1,17 @@
 from typing import BinaryIO, Any
 import json
+import os
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import FileConversionException
 from .._stream_info import StreamInfo
 
-CANDIDATE_MIME_TYPE_PREFIXES = [
-    "application/json",
-]
+CANDIDATE_MIME_TYPE_PREFIXES = ("application/json",)
 
-ACCEPTED_FILE_EXTENSIONS = [".ipynb"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".ipynb"})
+
+# Bytes read from each end of a JSON file to check whether it's a notebook
+NOTEBOOK_PROBE_SIZE = 8 * 1024
 
 
 class IpynbConverter(DocumentConverter):
@@ -27,19 +29,27 @@ class IpynbConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in CANDIDATE_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                # Read further to see if it's a notebook
-                cur_pos = file_stream.tell()
-                try:
-                    encoding = stream_info.charset or "utf-8"
-                    notebook_content = file_stream.read().decode(encoding)
-                    return (
-                        "nbformat" in notebook_content
-                        and "nbformat_minor" in notebook_content
-                    )
-                finally:
-                    file_stream.seek(cur_pos)
+        if mimetype.startswith(CANDIDATE_MIME_TYPE_PREFIXES):
+            # Read further to see if it's a notebook. Only the start and the
+            # end of the file are checked: nbformat writes the top-level keys
+            # sorted, so "nbformat" and "nbformat_minor" normally come last.
+            cur_pos = file_stream.tell()
+            try:
+                encoding = stream_info.charset or "utf-8"
+                head = file_stream.read(NOTEBOOK_PROBE_SIZE)
+                tail = b""
+                if len(head) == NOTEBOOK_PROBE_SIZE:
+                    file_stream.seek(-NOTEBOOK_PROBE_SIZE, os.SEEK_END)
+                    tail = file_stream.read()
+                notebook_content = "\n".join(
+                    block.decode(encoding, errors="ignore") for block in (head, tail)
+                )
+                return (
+                    "nbformat" in notebook_content
+                    and "nbformat_minor" in notebook_content
+                )
+            finally:
+                file_stream.seek(cur_pos)
 
         return False
 
@@ -65,10 +75,12 @@ class IpynbConverter(DocumentConverter):
                 source_lines = cell.get("source", [])
 
                 if cell_type == "markdown":
-                    md_output.append("".join(source_lines))
+                    markdown_text = "".join(source_lines)
+                    md_output.append(markdown_text)
 
-                    # Extract the first # heading as title if not already found
-                    if title is None:
+                    # Extract the first # heading as title if not already found.
+                    # Only scan the lines if the cell could contain one.
+                    if title is None and "# " in markdown_text:
                         for line in source_lines:
                             if line.startswith("# "):
                                 title = line.lstrip("# ").strip()
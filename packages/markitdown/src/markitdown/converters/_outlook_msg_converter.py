@@ -9,16 +9,26 @@ from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
 _dependency_exc_info = None
 olefile = None
 try:
+    # olefile >= 0.47 is needed: older versions close a caller-supplied file
+    # object on OleFileIO.close(), which accepts() relies on not happening
     import olefile  # type: ignore[no-redef]
 except ImportError:
     # Preserve the error and stack trace for later
     _dependency_exc_info = sys.exc_info()
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
-    "application/vnd.ms-outlook",
-]
+ACCEPTED_MIME_TYPE_PREFIXES = ("application/vnd.ms-outlook",)
 
-ACCEPTED_FILE_EXTENSIONS = [".msg"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".msg"})
+
+# Signature at the start of every OLE (Compound File Binary) file
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Encodings of MAPI string properties, by the property type at the end of the
+# stream name (e.g., __substg1.0_0037001F). PT_STRING8 (001E) isn't listed: its
+# code page comes from the message, so it gets the generic UTF-8 fallback.
+STRING_PROPERTY_ENCODINGS = {
+    "001F": "utf-16-le",  # PT_UNICODE
+}
 
 
 class OutlookMsgConverter(DocumentConverter):
@@ -42,27 +52,29 @@ class OutlookMsgConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES):
+            return True
+
+        if olefile is None:
+            return False
 
         # Brute force, check if we have an OLE file
         cur_pos = file_stream.tell()
         try:
-            if olefile and not olefile.isOleFile(file_stream):
+            if file_stream.read(len(OLE_MAGIC)) != OLE_MAGIC:
                 return False
         finally:
             file_stream.seek(cur_pos)
 
         # Brue force, check if it's an Outlook file
         try:
-            if olefile is not None:
-                msg = olefile.OleFileIO(file_stream)
-                toc = "\n".join([str(stream) for stream in msg.listdir()])
-                return (
-                    "__properties_version1.0" in toc
-                    and "__recip_version1.0_#00000000" in toc
+            msg = olefile.OleFileIO(file_stream)
+            try:
+                return msg.exists("__properties_version1.0") and msg.exists(
+                    "__recip_version1.0_#00000000"
                 )
+            finally:
+                msg.close()
         except Exception as e:
             pass
         finally:
@@ -134,16 +146,12 @@ class OutlookMsgConverter(DocumentConverter):
         try:
             if msg.exists(stream_path):
                 data = msg.openstream(stream_path).read()
-                # Try UTF-16 first (common for .msg files)
-                try:
-                    return data.decode("utf-16-le").strip()
-                except UnicodeDecodeError:
-                    # Fall back to UTF-8
-                    try:
-                        return data.decode("utf-8").strip()
-                    except UnicodeDecodeError:
-                        # Last resort - ignore errors
-                        return data.decode("utf-8", errors="ignore").strip()
+
+                # The property type suffix says how strings are stored
+                encoding = STRING_PROPERTY_ENCODINGS.get(
+                    stream_path[-4:].upper(), "utf-8"
+                )
+                return data.decode(encoding, errors="replace").strip()
         except Exception:
             pass
         return None
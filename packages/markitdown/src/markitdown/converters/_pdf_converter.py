@@ -20,12 +20,12 @@ except ImportError:
     _dependency_exc_info = sys.exc_info()
 
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "application/pdf",
     "application/x-pdf",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [".pdf"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".pdf"})
 
 
 class PdfConverter(DocumentConverter):
@@ -45,11 +45,7 @@ class PdfConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
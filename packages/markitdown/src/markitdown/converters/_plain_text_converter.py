@@ -1,33 +1,21 @@
-import sys
-
+import codecs
 from typing import BinaryIO, Any
 from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    import mammoth  # noqa: F401
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
-
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "text/",
     "application/json",
     "application/markdown",
-]
+)
+
+ACCEPTED_FILE_EXTENSIONS = frozenset(
+    {".txt", ".text", ".md", ".markdown", ".json", ".jsonl"}
+)
 
-ACCEPTED_FILE_EXTENSIONS = [
-    ".txt",
-    ".text",
-    ".md",
-    ".markdown",
-    ".json",
-    ".jsonl",
-]
+# Number of leading bytes used to guess the charset, when it isn't known
+CHARSET_DETECTION_SAMPLE_SIZE = 64 * 1024
 
 
 class PlainTextConverter(DocumentConverter):
@@ -51,11 +39,7 @@ class PlainTextConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -66,6 +50,35 @@ class PlainTextConverter(DocumentConverter):
         if stream_info.charset:
             text_content = file_stream.read().decode(stream_info.charset)
         else:
-            text_content = str(from_bytes(file_stream.read()).best())
+            text_content = _decode_text(file_stream.read())
 
         return DocumentConverterResult(markdown=text_content)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode text of unknown encoding, trying BOMs and UTF-8 before charset_normalizer."""
+    if data.startswith(codecs.BOM_UTF8):
+        return data.decode("utf-8-sig", errors="replace")
+    # The UTF-32-LE BOM starts with the UTF-16-LE one, so check it first
+    if data.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+        return data.decode("utf-32", errors="replace")
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return data.decode("utf-16", errors="replace")
+
+    # Most text is UTF-8 (or ASCII), which a strict decode confirms cheaply.
+    # NULs are valid UTF-8 too, but in text they point to BOM-less UTF-16/32.
+    if b"\x00" not in data[:CHARSET_DETECTION_SAMPLE_SIZE]:
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+
+    # Guess the encoding from a leading sample, rather than the whole input
+    best_guess = from_bytes(data[:CHARSET_DETECTION_SAMPLE_SIZE]).best()
+    if best_guess is None:
+        return data.decode("utf-8", errors="replace")
+    if len(data) <= CHARSET_DETECTION_SAMPLE_SIZE:
+        return str(best_guess)
+
+    # The guess only saw a sample, so don't fail on bytes it didn't see
+    return data.decode(best_guess.encoding, errors="replace")
@@ -6,7 +6,6 @@ import re
 import html
 
 from typing import BinaryIO, Any
-from operator import attrgetter
 
 from ._html_converter import HtmlConverter
 from ._llm_caption import llm_caption
@@ -24,11 +23,29 @@ except ImportError:
     _dependency_exc_info = sys.exc_info()
 
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "application/vnd.openxmlformats-officedocument.presentationml",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [".pptx"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".pptx"})
+
+# Characters that can't appear in markdown image alt text
+_ALT_TEXT_ESCAPES = str.maketrans("\r\n[]", "    ")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"\W")
+
+
+def _sort_shapes(shapes):
+    """
+    Sort shapes top-to-bottom, then left-to-right. Each position is read from
+    the XML once. Shapes that inherit their position (e.g., placeholders)
+    have no top/left, and sort as if they were at 0.
+    """
+    keyed = [
+        (shape.top or 0, shape.left or 0, i, shape) for i, shape in enumerate(shapes)
+    ]
+    keyed.sort()
+    return [shape for _, _, _, shape in keyed]
 
 
 class PptxConverter(DocumentConverter):
@@ -52,11 +69,7 @@ class PptxConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -80,17 +93,17 @@ class PptxConverter(DocumentConverter):
 
         # Perform the conversion
         presentation = pptx.Presentation(file_stream)
-        md_content = ""
+        md_slides = []
         slide_num = 0
         for slide in presentation.slides:
             slide_num += 1
 
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
+            # Collect the slide's pieces, and join them once at the end
+            md_parts = [f"\n\n<!-- Slide number: {slide_num} -->\n"]
 
             title = slide.shapes.title
 
             def get_shape_content(shape, **kwargs):
-                nonlocal md_content
                 # Pictures
                 if self._is_picture(shape):
                     # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
@@ -98,22 +111,27 @@ class PptxConverter(DocumentConverter):
                     llm_description = ""
                     alt_text = ""
 
+                    # python-pptx builds a new Image on every access, so it's
+                    # fetched (at most) once, and only if it's needed
+                    image = None
+
                     # Potentially generate a description using an LLM
                     llm_client = kwargs.get("llm_client")
                     llm_model = kwargs.get("llm_model")
                     if llm_client is not None and llm_model is not None:
                         # Prepare a file_stream and stream_info for the image data
-                        image_filename = shape.image.filename
+                        image = shape.image
+                        image_filename = image.filename
                         image_extension = None
                         if image_filename:
                             image_extension = os.path.splitext(image_filename)[1]
                         image_stream_info = StreamInfo(
-                            mimetype=shape.image.content_type,
+                            mimetype=image.content_type,
                             extension=image_extension,
                             filename=image_filename,
                         )
 
-                        image_stream = io.BytesIO(shape.image.blob)
+                        image_stream = io.BytesIO(image.blob)
 
                         # Caption the image
                         try:
@@ -137,55 +155,63 @@ class PptxConverter(DocumentConverter):
 
                     # Prepare the alt, escaping any special characters
                     alt_text = "\n".join([llm_description, alt_text]) or shape.name
-                    alt_text = re.sub(r"[\r\n\[\]]", " ", alt_text)
-                    alt_text = re.sub(r"\s+", " ", alt_text).strip()
+                    alt_text = _WHITESPACE_RE.sub(
+                        " ", alt_text.translate(_ALT_TEXT_ESCAPES)
+                    ).strip()
 
                     # If keep_data_uris is True, use base64 encoding for images
                     if kwargs.get("keep_data_uris", False):
-                        blob = shape.image.blob
-                        content_type = shape.image.content_type or "image/png"
-                        b64_string = base64.b64encode(blob).decode("utf-8")
-                        md_content += f"\n![{alt_text}](data:{content_type};base64,{b64_string})\n"
+                        if image is None:
+                            image = shape.image
+                        content_type = image.content_type or "image/png"
+                        b64_string = base64.b64encode(image.blob).decode("ascii")
+                        md_parts.append(
+                            f"\n![{alt_text}](data:{content_type};base64,{b64_string})\n"
+                        )
                     else:
                         # A placeholder name
-                        filename = re.sub(r"\W", "", shape.name) + ".jpg"
-                        md_content += "\n![" + alt_text + "](" + filename + ")\n"
+                        filename = _NON_WORD_RE.sub("", shape.name) + ".jpg"
+                        md_parts.append("\n![" + alt_text + "](" + filename + ")\n")
 
                 # Tables
                 if self._is_table(shape):
-                    md_content += self._convert_table_to_markdown(shape.table, **kwargs)
+                    md_parts.append(
+                        self._convert_table_to_markdown(shape.table, **kwargs)
+                    )
 
                 # Charts
                 if shape.has_chart:
-                    md_content += self._convert_chart_to_markdown(shape.chart)
+                    md_parts.append(self._convert_chart_to_markdown(shape.chart))
 
                 # Text areas
                 elif shape.has_text_frame:
                     if shape == title:
-                        md_content += "# " + shape.text.lstrip() + "\n"
+                        md_parts.append("# " + shape.text.lstrip() + "\n")
                     else:
-                        md_content += shape.text + "\n"
+                        md_parts.append(shape.text + "\n")
 
                 # Group Shapes
                 if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP:
-                    sorted_shapes = sorted(shape.shapes, key=attrgetter("top", "left"))
-                    for subshape in sorted_shapes:
+                    for subshape in _sort_shapes(shape.shapes):
                         get_shape_content(subshape, **kwargs)
 
-            sorted_shapes = sorted(slide.shapes, key=attrgetter("top", "left"))
-            for shape in sorted_shapes:
+            for shape in _sort_shapes(slide.shapes):
                 get_shape_content(shape, **kwargs)
 
-            md_content = md_content.strip()
+            # Each slide starts with its comment, so trimming the end of each
+            # slide (and the document at the end) matches trimming as we go
+            slide_md = "".join(md_parts).rstrip()
 
             if slide.has_notes_slide:
-                md_content += "\n\n### Notes:\n"
+                slide_md += "\n\n### Notes:\n"
                 notes_frame = slide.notes_slide.notes_text_frame
                 if notes_frame is not None:
-                    md_content += notes_frame.text
-                md_content = md_content.strip()
+                    slide_md += notes_frame.text
+                slide_md = slide_md.rstrip()
+
+            md_slides.append(slide_md)
 
-        return DocumentConverterResult(markdown=md_content.strip())
+        return DocumentConverterResult(markdown="".join(md_slides).strip())
 
     def _is_picture(self, shape):
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
@@ -202,18 +228,16 @@ class PptxConverter(DocumentConverter):
 
     def _convert_table_to_markdown(self, table, **kwargs):
         # Write the table as HTML, then convert it to Markdown
-        html_table = "<html><body><table>"
-        first_row = True
+        escape = html.escape
+        html_rows = []
+        cell_tag = "th"
         for row in table.rows:
-            html_table += "<tr>"
-            for cell in row.cells:
-                if first_row:
-                    html_table += "<th>" + html.escape(cell.text) + "</th>"
-                else:
-                    html_table += "<td>" + html.escape(cell.text) + "</td>"
-            html_table += "</tr>"
-            first_row = False
-        html_table += "</table></body></html>"
+            cells = "".join(
+                f"<{cell_tag}>{escape(cell.text)}</{cell_tag}>" for cell in row.cells
+            )
+            html_rows.append(f"<tr>{cells}</tr>")
+            cell_tag = "td"
+        html_table = f"<html><body><table>{''.join(html_rows)}</table></body></html>"
 
         return (
             self._html_converter.convert_string(html_table, **kwargs).markdown.strip()
@@ -226,23 +250,23 @@ class PptxConverter(DocumentConverter):
             if chart.has_title:
                 md += f": {chart.chart_title.text_frame.text}"
             md += "\n\n"
-            data = []
             category_names = [c.label for c in chart.plots[0].categories]
-            series_names = [s.name for s in chart.series]
-            data.append(["Category"] + series_names)
 
+            # Series.values is rebuilt from the XML on every access, so read
+            # each series once
+            series_list = list(chart.series)
+            series_values = [series.values for series in series_list]
+
+            markdown_table = [
+                "| "
+                + " | ".join(["Category"] + [str(s.name) for s in series_list])
+                + " |",
+                "|" + "|".join(["---"] * (len(series_list) + 1)) + "|",
+            ]
             for idx, category in enumerate(category_names):
-                row = [category]
-                for series in chart.series:
-                    row.append(series.values[idx])
-                data.append(row)
-
-            markdown_table = []
-            for row in data:
-                markdown_table.append("| " + " | ".join(map(str, row)) + " |")
-            header = markdown_table[0]
-            separator = "|" + "|".join(["---"] * len(data[0])) + "|"
-            return md + "\n".join([header, separator] + markdown_table[1:])
+                row = [str(category)] + [str(values[idx]) for values in series_values]
+                markdown_table.append("| " + " | ".join(row) + " |")
+            return md + "\n".join(markdown_table)
         except ValueError as e:
             # Handle the specific error for unsupported chart types
             if "unsupported plot type" in str(e):
@@ -1,29 +1,38 @@
-from defusedxml import minidom
-from xml.dom.minidom import Document, Element
+from defusedxml import ElementTree
+from xml.etree.ElementTree import Element
 from typing import BinaryIO, Any, Union
 from bs4 import BeautifulSoup
 
+from ._html_converter import _HTML_PARSER
 from ._markdownify import _CustomMarkdownify
 from .._stream_info import StreamInfo
 from .._base_converter import DocumentConverter, DocumentConverterResult
 
-PRECISE_MIME_TYPE_PREFIXES = [
+PRECISE_MIME_TYPE_PREFIXES = (
     "application/rss",
     "application/rss+xml",
     "application/atom",
     "application/atom+xml",
-]
+)
 
-PRECISE_FILE_EXTENSIONS = [".rss", ".atom"]
+PRECISE_FILE_EXTENSIONS = frozenset({".rss", ".atom"})
 
-CANDIDATE_MIME_TYPE_PREFIXES = [
+CANDIDATE_MIME_TYPE_PREFIXES = (
     "text/xml",
     "application/xml",
-]
+)
 
-CANDIDATE_FILE_EXTENSIONS = [
-    ".xml",
-]
+CANDIDATE_FILE_EXTENSIONS = frozenset({".xml"})
+
+
+def _namespace(tag: str) -> str:
+    """Return the "{uri}" prefix of an ElementTree tag (or "" if it has none)."""
+    return tag[: tag.index("}") + 1] if tag.startswith("{") else ""
+
+
+def _local_name(tag: str) -> str:
+    """Return an ElementTree tag without its namespace."""
+    return tag[len(_namespace(tag)) :]
 
 
 class RssConverter(DocumentConverter):
@@ -31,7 +40,7 @@ class RssConverter(DocumentConverter):
 
     def __init__(self):
         super().__init__()
-        self._kwargs = {}
+        self._markdownify = _CustomMarkdownify()
 
     def accepts(
         self,
@@ -46,37 +55,40 @@ class RssConverter(DocumentConverter):
         if extension in PRECISE_FILE_EXTENSIONS:
             return True
 
-        for prefix in PRECISE_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(PRECISE_MIME_TYPE_PREFIXES):
+            return True
 
         # Check for precise mimetypes and file extensions
         if extension in CANDIDATE_FILE_EXTENSIONS:
             return self._check_xml(file_stream)
 
-        for prefix in CANDIDATE_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return self._check_xml(file_stream)
+        if mimetype.startswith(CANDIDATE_MIME_TYPE_PREFIXES):
+            return self._check_xml(file_stream)
 
         return False
 
     def _check_xml(self, file_stream: BinaryIO) -> bool:
         cur_pos = file_stream.tell()
         try:
-            doc = minidom.parse(file_stream)
-            return self._feed_type(doc) is not None
+            return self._feed_type(file_stream) is not None
         except BaseException as _:
             pass
         finally:
             file_stream.seek(cur_pos)
         return False
 
-    def _feed_type(self, doc: Any) -> str | None:
-        if doc.getElementsByTagName("rss"):
-            return "rss"
-        elif doc.getElementsByTagName("feed"):
-            root = doc.getElementsByTagName("feed")[0]
-            if root.getElementsByTagName("entry"):
+    def _feed_type(self, file_stream: BinaryIO) -> str | None:
+        # Only the opening tags near the top of the document are needed, so
+        # stop parsing as soon as the answer is known
+        root_tag = None
+        for _, elem in ElementTree.iterparse(file_stream, events=("start",)):
+            if root_tag is None:
+                root_tag = elem.tag
+                if root_tag == "rss":
+                    return "rss"
+                elif _local_name(root_tag) != "feed":
+                    return None
+            elif elem.tag == _namespace(root_tag) + "entry":
                 # An Atom feed must have a root element of <feed> and at least one <entry>
                 return "atom"
         return None
@@ -87,92 +99,131 @@ class RssConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        self._kwargs = kwargs
-        doc = minidom.parse(file_stream)
-        feed_type = self._feed_type(doc)
+        # Shared by all the items in the feed
+        self._markdownify = _CustomMarkdownify(**kwargs)
+        cur_pos = file_stream.tell()
+        feed_type = self._feed_type(file_stream)
+        file_stream.seek(cur_pos)
 
         if feed_type == "rss":
-            return self._parse_rss_type(doc)
+            return self._parse_rss_type(file_stream)
         elif feed_type == "atom":
-            return self._parse_atom_type(doc)
+            return self._parse_atom_type(file_stream)
         else:
             raise ValueError("Unknown feed type")
 
-    def _parse_atom_type(self, doc: Document) -> DocumentConverterResult:
+    def _parse_atom_type(self, file_stream: BinaryIO) -> DocumentConverterResult:
         """Parse the type of an Atom feed.
 
         Returns None if the feed type is not recognized or something goes wrong.
         """
-        root = doc.getElementsByTagName("feed")[0]
-        title = self._get_data_by_tag_name(root, "title")
-        subtitle = self._get_data_by_tag_name(root, "subtitle")
-        entries = root.getElementsByTagName("entry")
+        # Entries are converted (and then discarded) as soon as they are parsed
+        root = None
+        md_entries = []
+        for event, elem in ElementTree.iterparse(file_stream, events=("start", "end")):
+            if root is None:
+                root = elem
+                ns = _namespace(root.tag)
+            elif event == "end" and elem.tag == ns + "entry":
+                md_entries.append(self._parse_atom_entry(elem, ns))
+                elem.clear()
+        assert root is not None
+
+        title = self._get_data_by_tag_name(root, ns + "title")
+        subtitle = self._get_data_by_tag_name(root, ns + "subtitle")
         md_text = f"# {title}\n"
         if subtitle:
             md_text += f"{subtitle}\n"
-        for entry in entries:
-            entry_title = self._get_data_by_tag_name(entry, "title")
-            entry_summary = self._get_data_by_tag_name(entry, "summary")
-            entry_updated = self._get_data_by_tag_name(entry, "updated")
-            entry_content = self._get_data_by_tag_name(entry, "content")
-
-            if entry_title:
-                md_text += f"\n## {entry_title}\n"
-            if entry_updated:
-                md_text += f"Updated on: {entry_updated}\n"
-            if entry_summary:
-                md_text += self._parse_content(entry_summary)
-            if entry_content:
-                md_text += self._parse_content(entry_content)
 
         return DocumentConverterResult(
-            markdown=md_text,
+            markdown=md_text + "".join(md_entries),
             title=title,
         )
 
-    def _parse_rss_type(self, doc: Document) -> DocumentConverterResult:
+    def _parse_atom_entry(self, entry: Element, ns: str) -> str:
+        """Convert a single Atom <entry> to Markdown"""
+        entry_title = self._get_data_by_tag_name(entry, ns + "title")
+        entry_summary = self._get_data_by_tag_name(entry, ns + "summary")
+        entry_updated = self._get_data_by_tag_name(entry, ns + "updated")
+        entry_content = self._get_data_by_tag_name(entry, ns + "content")
+
+        md_parts = []
+        if entry_title:
+            md_parts.append(f"\n## {entry_title}\n")
+        if entry_updated:
+            md_parts.append(f"Updated on: {entry_updated}\n")
+        if entry_summary:
+            md_parts.append(self._parse_content(entry_summary))
+        if entry_content:
+            md_parts.append(self._parse_content(entry_content))
+        return "".join(md_parts)
+
+    def _parse_rss_type(self, file_stream: BinaryIO) -> DocumentConverterResult:
         """Parse the type of an RSS feed.
 
         Returns None if the feed type is not recognized or something goes wrong.
         """
-        root = doc.getElementsByTagName("rss")[0]
-        channel_list = root.getElementsByTagName("channel")
-        if not channel_list:
+        # Items are converted (and then discarded) as soon as they are parsed
+        channel = None
+        content_tag = None
+        md_items = []
+        for event, elem in ElementTree.iterparse(
+            file_stream, events=("start-ns", "end")
+        ):
+            if event == "start-ns":
+                # Tags are namespace-qualified, so look up <content:encoded>
+                # by whatever namespace the "content" prefix is bound to
+                prefix, uri = elem
+                if prefix == "content":
+                    content_tag = f"{{{uri}}}encoded"
+            elif elem.tag == "item":
+                md_items.append(self._parse_rss_item(elem, content_tag))
+                elem.clear()
+            elif elem.tag == "channel" and channel is None:
+                channel = elem
+        if channel is None:
             raise ValueError("No channel found in RSS feed")
-        channel = channel_list[0]
+
         channel_title = self._get_data_by_tag_name(channel, "title")
         channel_description = self._get_data_by_tag_name(channel, "description")
-        items = channel.getElementsByTagName("item")
         if channel_title:
             md_text = f"# {channel_title}\n"
         if channel_description:
             md_text += f"{channel_description}\n"
-        for item in items:
-            title = self._get_data_by_tag_name(item, "title")
-            description = self._get_data_by_tag_name(item, "description")
-            pubDate = self._get_data_by_tag_name(item, "pubDate")
-            content = self._get_data_by_tag_name(item, "content:encoded")
-
-            if title:
-                md_text += f"\n## {title}\n"
-            if pubDate:
-                md_text += f"Published on: {pubDate}\n"
-            if description:
-                md_text += self._parse_content(description)
-            if content:
-                md_text += self._parse_content(content)
 
         return DocumentConverterResult(
-            markdown=md_text,
+            markdown=md_text + "".join(md_items),
             title=channel_title,
         )
 
+    def _parse_rss_item(self, item: Element, content_tag: str | None) -> str:
+        """Convert a single RSS <item> to Markdown"""
+        title = self._get_data_by_tag_name(item, "title")
+        description = self._get_data_by_tag_name(item, "description")
+        pubDate = self._get_data_by_tag_name(item, "pubDate")
+        content = (
+            None
+            if content_tag is None
+            else self._get_data_by_tag_name(item, content_tag)
+        )
+
+        md_parts = []
+        if title:
+            md_parts.append(f"\n## {title}\n")
+        if pubDate:
+            md_parts.append(f"Published on: {pubDate}\n")
+        if description:
+            md_parts.append(self._parse_content(description))
+        if content:
+            md_parts.append(self._parse_content(content))
+        return "".join(md_parts)
+
     def _parse_content(self, content: str) -> str:
         """Parse the content of an RSS feed item"""
         try:
             # using bs4 because many RSS feeds have HTML-styled content
-            soup = BeautifulSoup(content, "html.parser")
-            return _CustomMarkdownify(**self._kwargs).convert_soup(soup)
+            soup = BeautifulSoup(content, _HTML_PARSER)
+            return self._markdownify.convert_soup(soup)
         except BaseException as _:
             return content
 
@@ -182,11 +233,7 @@ class RssConverter(DocumentConverter):
         """Get data from first child element with the given tag name.
         Returns None when no such element is found.
         """
-        nodes = element.getElementsByTagName(tag_name)
-        if not nodes:
+        node = element.find(f".//{tag_name}")
+        if node is None:
             return None
-        fc = nodes[0].firstChild
-        if fc:
-            if hasattr(fc, "data"):
-                return fc.data
-        return None
+        return node.text
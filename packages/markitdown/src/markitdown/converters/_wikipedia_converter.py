@@ -4,17 +4,42 @@ from typing import Any, BinaryIO
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from ._html_converter import _HTML_PARSER
 from ._markdownify import _CustomMarkdownify
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "text/html",
     "application/xhtml",
-]
+)
 
-ACCEPTED_FILE_EXTENSIONS = [
-    ".html",
-    ".htm",
-]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".html", ".htm"})
+
+_WIKIPEDIA_URL_RE = re.compile(r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/")
+
+
+class _WikipediaStrainer(bs4.SoupStrainer):
+    """
+    Only builds the parts of the page that are converted: the <title>, the
+    page title span, and the main content (div#mw-content-text).
+    """
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name == "title":
+            return True
+        if not attrs:
+            return False
+        if name == "div":
+            return attrs.get("id") == "mw-content-text"
+        if name == "span":
+            return "mw-page-title-main" in (attrs.get("class") or "").split()
+        return False
+
+
+# The allow_tag_creation hook was added in beautifulsoup4 4.13. Older versions
+# just build the whole page.
+_PARSE_ONLY = (
+    _WikipediaStrainer() if hasattr(bs4.SoupStrainer, "allow_tag_creation") else None
+)
 
 
 class WikipediaConverter(DocumentConverter):
@@ -34,16 +59,15 @@ class WikipediaConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if not re.search(r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/", url):
+        if not _WIKIPEDIA_URL_RE.match(url):
             # Not a Wikipedia URL
             return False
 
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES):
+            return True
 
         # Not HTML content
         return False
@@ -56,7 +80,17 @@ class WikipediaConverter(DocumentConverter):
     ) -> DocumentConverterResult:
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        cur_pos = file_stream.tell()
+        soup = bs4.BeautifulSoup(
+            file_stream, _HTML_PARSER, from_encoding=encoding, parse_only=_PARSE_ONLY
+        )
+        if (
+            _PARSE_ONLY is not None
+            and soup.find("div", {"id": "mw-content-text"}) is None
+        ):
+            # Not an article, so the whole page is converted after all
+            file_stream.seek(cur_pos)
+            soup = bs4.BeautifulSoup(file_stream, _HTML_PARSER, from_encoding=encoding)
 
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
@@ -21,16 +21,31 @@ try:
 except ImportError:
     _xls_dependency_exc_info = sys.exc_info()
 
-ACCEPTED_XLSX_MIME_TYPE_PREFIXES = [
-    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-]
-ACCEPTED_XLSX_FILE_EXTENSIONS = [".xlsx"]
+# Read workbooks with the (much faster) calamine engine when it's installed,
+# and pandas is new enough to support it (2.2+). Otherwise, use openpyxl/xlrd.
+_calamine_available = False
+try:
+    import pandas as pd  # noqa: F811
+    import python_calamine  # noqa: F401
+
+    _pandas_version = tuple(int(v) for v in pd.__version__.split(".")[:2])
+    _calamine_available = _pandas_version >= (2, 2)
+except (ImportError, ValueError):
+    pass
+
+_XLSX_ENGINE = "calamine" if _calamine_available else "openpyxl"
+_XLS_ENGINE = "calamine" if _calamine_available else "xlrd"
 
-ACCEPTED_XLS_MIME_TYPE_PREFIXES = [
+ACCEPTED_XLSX_MIME_TYPE_PREFIXES = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+)
+ACCEPTED_XLSX_FILE_EXTENSIONS = frozenset({".xlsx"})
+
+ACCEPTED_XLS_MIME_TYPE_PREFIXES = (
     "application/vnd.ms-excel",
     "application/excel",
-]
-ACCEPTED_XLS_FILE_EXTENSIONS = [".xls"]
+)
+ACCEPTED_XLS_FILE_EXTENSIONS = frozenset({".xls"})
 
 
 class XlsxConverter(DocumentConverter):
@@ -54,11 +69,7 @@ class XlsxConverter(DocumentConverter):
         if extension in ACCEPTED_XLSX_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_XLSX_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_XLSX_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -80,19 +91,19 @@ class XlsxConverter(DocumentConverter):
                 _xlsx_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="openpyxl")
-        md_content = ""
+        sheets = pd.read_excel(file_stream, sheet_name=None, engine=_XLSX_ENGINE)
+        md_parts = []
         for s in sheets:
-            md_content += f"## {s}\n"
+            md_parts.append(f"## {s}\n")
             html_content = sheets[s].to_html(index=False)
-            md_content += (
+            md_parts.append(
                 self._html_converter.convert_string(
                     html_content, **kwargs
                 ).markdown.strip()
                 + "\n\n"
             )
 
-        return DocumentConverterResult(markdown=md_content.strip())
+        return DocumentConverterResult(markdown="".join(md_parts).strip())
 
 
 class XlsConverter(DocumentConverter):
@@ -116,11 +127,7 @@ class XlsConverter(DocumentConverter):
         if extension in ACCEPTED_XLS_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_XLS_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_XLS_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -142,16 +149,16 @@ class XlsConverter(DocumentConverter):
                 _xls_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="xlrd")
-        md_content = ""
+        sheets = pd.read_excel(file_stream, sheet_name=None, engine=_XLS_ENGINE)
+        md_parts = []
         for s in sheets:
-            md_content += f"## {s}\n"
+            md_parts.append(f"## {s}\n")
             html_content = sheets[s].to_html(index=False)
-            md_content += (
+            md_parts.append(
                 self._html_converter.convert_string(
                     html_content, **kwargs
                 ).markdown.strip()
                 + "\n\n"
             )
 
-        return DocumentConverterResult(markdown=md_content.strip())
+        return DocumentConverterResult(markdown="".join(md_parts).strip())
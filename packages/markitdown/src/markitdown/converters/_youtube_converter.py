@@ -1,37 +1,48 @@
 import json
 import time
+import random
 import re
+import warnings
 import bs4
 from typing import Any, BinaryIO, Dict, List, Union
 from urllib.parse import parse_qs, urlparse, unquote
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from ._html_converter import _HTML_PARSER
 
 # Optional YouTube transcription support
 try:
     # Suppress some warnings on library import
-    import warnings
-
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=SyntaxWarning)
         # Patch submitted upstream to fix the SyntaxWarning
-        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api import (
+            YouTubeTranscriptApi,
+            NoTranscriptFound,
+            TranscriptsDisabled,
+        )
+
+    # Errors that retrying won't fix
+    _PERMANENT_TRANSCRIPT_ERRORS: tuple = (NoTranscriptFound, TranscriptsDisabled)
 
     IS_YOUTUBE_TRANSCRIPT_CAPABLE = True
 except ModuleNotFoundError:
+    _PERMANENT_TRANSCRIPT_ERRORS = ()
     IS_YOUTUBE_TRANSCRIPT_CAPABLE = False
 
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
+ACCEPTED_MIME_TYPE_PREFIXES = (
     "text/html",
     "application/xhtml",
-]
+)
+
+ACCEPTED_FILE_EXTENSIONS = frozenset({".html", ".htm"})
 
-ACCEPTED_FILE_EXTENSIONS = [
-    ".html",
-    ".htm",
-]
+_YT_INITIAL_DATA_RE = re.compile(r"var ytInitialData = ({.*?});")
+
+# <meta> attributes that name the metadata key
+_META_KEY_ATTRIBUTES = frozenset({"itemprop", "property", "name"})
 
 
 class YouTubeConverter(DocumentConverter):
@@ -60,9 +71,8 @@ class YouTubeConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES):
+            return True
 
         # Not HTML content
         return False
@@ -73,9 +83,15 @@ class YouTubeConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Parse the stream
+        # Parse the stream. Watch pages are mostly inline JavaScript, so only
+        # the <title> and <meta> tags are built into a tree.
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        html_content = file_stream.read().decode(encoding, errors="replace")
+        soup = bs4.BeautifulSoup(
+            html_content,
+            _HTML_PARSER,
+            parse_only=bs4.SoupStrainer(["title", "meta"]),
+        )
 
         # Read the meta tags
         metadata: Dict[str, str] = {}
@@ -88,29 +104,22 @@ class YouTubeConverter(DocumentConverter):
                 continue
 
             for a in meta.attrs:
-                if a in ["itemprop", "property", "name"]:
+                if a in _META_KEY_ATTRIBUTES:
                     key = str(meta.get(a, ""))
                     content = str(meta.get("content", ""))
                     if key and content:  # Only add non-empty content
                         metadata[key] = content
                     break
 
-        # Try reading the description
+        # Try reading the description, straight from the page's inline script
         try:
-            for script in soup(["script"]):
-                if not isinstance(script, bs4.Tag):
-                    continue
-                if not script.string:  # Skip empty scripts
-                    continue
-                content = script.string
-                if "ytInitialData" in content:
-                    match = re.search(r"var ytInitialData = ({.*?});", content)
-                    if match:
-                        data = json.loads(match.group(1))
-                        attrdesc = self._findKey(data, "attributedDescriptionBodyText")
-                        if attrdesc and isinstance(attrdesc, dict):
-                            metadata["description"] = str(attrdesc.get("content", ""))
-                    break
+            match = _YT_INITIAL_DATA_RE.search(html_content)
+            # Don't decode megabytes of JSON if the key isn't in there at all
+            if match and '"attributedDescriptionBodyText"' in match.group(1):
+                data = json.loads(match.group(1))
+                attrdesc = self._findKey(data, "attributedDescriptionBodyText")
+                if attrdesc and isinstance(attrdesc, dict):
+                    metadata["description"] = str(attrdesc.get("content", ""))
         except Exception as e:
             print(f"Error extracting description: {e}")
             pass
@@ -166,7 +175,7 @@ class YouTubeConverter(DocumentConverter):
                             video_id, languages=youtube_transcript_languages
                         ),
                         retries=3,  # Retry 3 times
-                        delay=2,  # 2 seconds delay between retries
+                        base_delay=0.5,  # Then wait ~0.5s, ~1s between retries
                     )
 
                     if transcript:
@@ -223,16 +232,19 @@ class YouTubeConverter(DocumentConverter):
                     return result
         return None
 
-    def _retry_operation(self, operation, retries=3, delay=2):
-        """Retries the operation if it fails."""
+    def _retry_operation(self, operation, retries=3, base_delay=0.5):
+        """Retries the operation if it fails, with exponential backoff and jitter."""
         attempt = 0
         while attempt < retries:
             try:
                 return operation()  # Attempt the operation
+            except _PERMANENT_TRANSCRIPT_ERRORS:
+                raise
             except Exception as e:
-                print(f"Attempt {attempt + 1} failed: {e}")
+                warnings.warn(f"Attempt {attempt + 1} failed: {e}")
                 if attempt < retries - 1:
-                    time.sleep(delay)  # Wait before retrying
+                    # Wait before retrying
+                    time.sleep(base_delay * 2**attempt + random.uniform(0, 0.25))
                 attempt += 1
         # If all attempts fail, raise the last exception
         raise Exception(f"Operation failed after {retries} attempts.")
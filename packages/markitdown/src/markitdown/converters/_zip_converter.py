@@ -12,11 +12,9 @@ from .._exceptions import UnsupportedFormatException, FileConversionException
 if TYPE_CHECKING:
     from .._markitdown import MarkItDown
 
-ACCEPTED_MIME_TYPE_PREFIXES = [
-    "application/zip",
-]
+ACCEPTED_MIME_TYPE_PREFIXES = ("application/zip",)
 
-ACCEPTED_FILE_EXTENSIONS = [".zip"]
+ACCEPTED_FILE_EXTENSIONS = frozenset({".zip"})
 
 
 class ZipConverter(DocumentConverter):
@@ -78,11 +76,7 @@ class ZipConverter(DocumentConverter):
         if extension in ACCEPTED_FILE_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
-
-        return False
+        return mimetype.startswith(ACCEPTED_MIME_TYPE_PREFIXES)
 
     def convert(
         self,
@@ -91,10 +85,14 @@ class ZipConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         file_path = stream_info.url or stream_info.local_path or stream_info.filename
-        md_content = f"Content from the zip file `{file_path}`:\n\n"
+        md_parts = [f"Content from the zip file `{file_path}`:\n\n"]
 
         with zipfile.ZipFile(file_stream, "r") as zipObj:
-            for name in zipObj.namelist():
+            for info in zipObj.infolist():
+                # Directory entries have no content to convert
+                if info.is_dir():
+                    continue
+                name = info.filename
                 try:
                     z_file_stream = io.BytesIO(zipObj.read(name))
                     z_file_stream_info = StreamInfo(
@@ -106,11 +104,11 @@ class ZipConverter(DocumentConverter):
                         stream_info=z_file_stream_info,
                     )
                     if result is not None:
-                        md_content += f"## File: {name}\n\n"
-                        md_content += result.markdown + "\n\n"
+                        md_parts.append(f"## File: {name}\n\n")
+                        md_parts.append(result.markdown + "\n\n")
                 except UnsupportedFormatException:
                     pass
                 except FileConversionException:
                     pass
 
-        return DocumentConverterResult(markdown=md_content.strip())
+        return DocumentConverterResult(markdown="".join(md_parts).strip())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# A stand-in for exiftool, used by the exiftool tests in test_module_misc.py.
+#
+# It speaks enough of exiftool's command-line protocol for markitdown:
+#   exiftool -json -                  (one-shot, file content on stdin)
+#   exiftool -stay_open True -@ -     (arguments on stdin, one per line, each
+#                                      request ended by -execute, and each
+#                                      response ended by a {ready} line)
+#
+# Each response reports which mode produced it, the pid that produced it,
+# and the path and size of the file it read. FAKE_EXIFTOOL_MODE changes the behavior:
+#   no_stay_open   exit at once when started with -stay_open
+#   hang           never answer a -stay_open request
+import json
+import os
+import sys
+import time
+
+MODE = os.environ.get("FAKE_EXIFTOOL_MODE", "")
+
+
+def respond(mode: str, source_file: str, data: bytes) -> None:
+    metadata = {
+        "SourceFile": source_file,
+        "Mode": mode,
+        "Pid": os.getpid(),
+        "FileSize": len(data),
+    }
+    sys.stdout.write(json.dumps([metadata]) + "\n")
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if args[:2] != ["-stay_open", "True"]:
+        respond("one_shot", "-", sys.stdin.buffer.read())
+        sys.stdout.flush()
+        return
+
+    if MODE == "no_stay_open":
+        sys.exit(1)
+
+    request: list = []
+    for line in sys.stdin:
+        arg = line.rstrip("\n")
+        if arg != "-execute":
+            request.append(arg)
+            # Like exiftool, stop as soon as "-stay_open False" is read
+            if request[-2:] == ["-stay_open", "False"]:
+                return
+            continue
+
+        if MODE == "hang":
+            time.sleep(3600)
+
+        with open(request[-1], "rb") as fh:
+            respond("stay_open", request[-1], fh.read())
+        sys.stdout.write("{ready}\n")
+        sys.stdout.flush()
+        request = []
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import dataclasses
+import pytest
 from typing import List
 
 
@@ -10,6 +11,14 @@ class FileTestVector(object):
     url: str | None
     must_include: List[str]
     must_not_include: List[str]
+    slow: bool = False  # Deselect with `pytest -m "not slow"`
+
+
+def vector_params(test_vectors: List[FileTestVector]) -> list:
+    """Wrap the vectors for @pytest.mark.parametrize, marking the slow ones."""
+    return [
+        pytest.param(v, marks=pytest.mark.slow) if v.slow else v for v in test_vectors
+    ]
 
 
 GENERAL_TEST_VECTORS = [
@@ -122,6 +131,7 @@ GENERAL_TEST_VECTORS = [
             "154 languages",
             "move to sidebar",
         ],
+        slow=True,
     ),
     FileTestVector(
         filename="test_serp.html",
@@ -215,6 +225,7 @@ GENERAL_TEST_VECTORS = [
             'Microsoft was founded by [Bill Gates](/wiki/Bill_Gates "Bill Gates")',
         ],
         must_not_include=[],
+        slow=True,
     ),
     FileTestVector(
         filename="test.epub",
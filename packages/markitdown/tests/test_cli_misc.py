@@ -1,4 +1,6 @@
 #!/usr/bin/env python3 -m pytest
+import os
+import sys
 import subprocess
 from markitdown import __version__
 
@@ -8,7 +10,9 @@ from markitdown import __version__
 
 def test_version() -> None:
     result = subprocess.run(
-        ["python", "-m", "markitdown", "--version"], capture_output=True, text=True
+        [sys.executable, "-m", "markitdown", "--version"],
+        capture_output=True,
+        text=True,
     )
 
     assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
@@ -17,7 +21,7 @@ def test_version() -> None:
 
 def test_invalid_flag() -> None:
     result = subprocess.run(
-        ["python", "-m", "markitdown", "--foobar"], capture_output=True, text=True
+        [sys.executable, "-m", "markitdown", "--foobar"], capture_output=True, text=True
     )
 
     assert result.returncode != 0, f"CLI exited with error: {result.stderr}"
@@ -27,6 +31,20 @@ def test_invalid_flag() -> None:
     assert "SYNTAX" in result.stderr, "Expected 'SYNTAX' to appear in STDERR"
 
 
+def test_unencodable_output(tmp_path) -> None:
+    # Characters that stdout can't encode are replaced, rather than failing
+    input_file = tmp_path / "test.html"
+    input_file.write_text("<p>Caf&eacute; &#9731;</p>", encoding="ascii")
+    result = subprocess.run(
+        [sys.executable, "-m", "markitdown", str(input_file)],
+        capture_output=True,
+        env={**os.environ, "PYTHONIOENCODING": "ascii"},
+    )
+
+    assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
+    assert result.stdout == b"Caf? ?\n"
+
+
 if __name__ == "__main__":
     """Runs this file's tests from the command line."""
     test_version()
@@ -1,22 +1,29 @@
 #!/usr/bin/env python3 -m pytest
 import os
+import io
+import sys
 import time
 import pytest
 import subprocess
-import locale
-from typing import List
+import contextlib
+from typing import List, Union
+from unittest import mock
+
+from markitdown.__main__ import main
 
 if __name__ == "__main__":
     from _test_vectors import (
         GENERAL_TEST_VECTORS,
         DATA_URI_TEST_VECTORS,
         FileTestVector,
+        vector_params,
     )
 else:
     from ._test_vectors import (
         GENERAL_TEST_VECTORS,
         DATA_URI_TEST_VECTORS,
         FileTestVector,
+        vector_params,
     )
 
 skip_remote = (
@@ -26,6 +33,9 @@ skip_remote = (
 TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
 TEST_FILES_URL = "https://raw.githubusercontent.com/microsoft/markitdown/refs/heads/main/packages/markitdown/tests/test_files"
 
+# Encoding of the CLI's (captured) stdin and stdout
+CLI_ENCODING = "utf-8"
+
 
 # Prepare CLI test vectors (remove vectors that require mockig the url)
 CLI_TEST_VECTORS: List[FileTestVector] = []
@@ -40,18 +50,45 @@ def shared_tmp_dir(tmp_path_factory):
     return tmp_path_factory.mktemp("pytest_tmp")
 
 
-@pytest.mark.parametrize("test_vector", CLI_TEST_VECTORS)
+def run_cli(
+    args: List[str], input: bytes = b"", text: bool = False
+) -> subprocess.CompletedProcess:
+    """
+    Run `python -m markitdown <args>` in-process, rather than paying for a new
+    interpreter (and fresh imports) for every test. The result mirrors what
+    subprocess.run(..., capture_output=True) returns.
+    """
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding=CLI_ENCODING)
+    stderr = io.StringIO()
+    stdin = io.TextIOWrapper(io.BytesIO(input), encoding=CLI_ENCODING)
+
+    returncode: Union[int, str, None] = 0
+    with mock.patch.object(sys, "argv", ["markitdown"] + args), mock.patch.object(
+        sys, "stdin", stdin
+    ), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            main()
+        except SystemExit as e:
+            returncode = e.code
+
+    stdout.flush()
+    output = stdout.buffer.getvalue()  # type: ignore[attr-defined]
+    return subprocess.CompletedProcess(
+        args=args,
+        returncode=returncode if isinstance(returncode, int) else 1,
+        stdout=output.decode(CLI_ENCODING) if text else output,
+        stderr=(stderr.getvalue() if text else stderr.getvalue().encode(CLI_ENCODING)),
+    )
+
+
+@pytest.mark.parametrize("test_vector", vector_params(CLI_TEST_VECTORS))
 def test_output_to_stdout(shared_tmp_dir, test_vector) -> None:
     """Test that the CLI outputs to stdout correctly."""
 
-    result = subprocess.run(
+    result = run_cli(
         [
-            "python",
-            "-m",
-            "markitdown",
             os.path.join(TEST_FILES_DIR, test_vector.filename),
         ],
-        capture_output=True,
         text=True,
     )
 
@@ -62,62 +99,46 @@ def test_output_to_stdout(shared_tmp_dir, test_vector) -> None:
         assert test_string not in result.stdout
 
 
-@pytest.mark.parametrize("test_vector", CLI_TEST_VECTORS)
-def test_output_to_file(shared_tmp_dir, test_vector) -> None:
+@pytest.mark.parametrize("test_vector", vector_params(CLI_TEST_VECTORS))
+def test_output_to_file(tmp_path, test_vector) -> None:
     """Test that the CLI outputs to a file correctly."""
 
-    output_file = os.path.join(shared_tmp_dir, test_vector.filename + ".output")
-    result = subprocess.run(
+    output_file = os.path.join(tmp_path, test_vector.filename + ".output")
+    result = run_cli(
         [
-            "python",
-            "-m",
-            "markitdown",
             "-o",
             output_file,
             os.path.join(TEST_FILES_DIR, test_vector.filename),
         ],
-        capture_output=True,
         text=True,
     )
 
     assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
     assert os.path.exists(output_file), f"Output file not created: {output_file}"
 
-    with open(output_file, "r") as f:
+    with open(output_file, "r", encoding="utf-8") as f:
         output_data = f.read()
         for test_string in test_vector.must_include:
             assert test_string in output_data
         for test_string in test_vector.must_not_include:
             assert test_string not in output_data
 
-    os.remove(output_file)
-    assert not os.path.exists(output_file), f"Output file not deleted: {output_file}"
-
 
-@pytest.mark.parametrize("test_vector", CLI_TEST_VECTORS)
+@pytest.mark.parametrize("test_vector", vector_params(CLI_TEST_VECTORS))
 def test_input_from_stdin_without_hints(shared_tmp_dir, test_vector) -> None:
-    """Test that the CLI readds from stdin correctly."""
+    """Test that the CLI reads from stdin correctly."""
 
     test_input = b""
     with open(os.path.join(TEST_FILES_DIR, test_vector.filename), "rb") as stream:
         test_input = stream.read()
 
-    result = subprocess.run(
-        [
-            "python",
-            "-m",
-            "markitdown",
-            os.path.join(TEST_FILES_DIR, test_vector.filename),
-        ],
-        input=test_input,
-        capture_output=True,
-        text=False,
-    )
+    # No filename, so the CLI has to read (and identify) the file from stdin
+    result = run_cli([], input=test_input)
 
-    stdout = result.stdout.decode(locale.getpreferredencoding())
+    stdout = result.stdout.decode(CLI_ENCODING)
     assert (
         result.returncode == 0
-    ), f"CLI exited with error: {result.stderr.decode('utf-8')}"
+    ), f"CLI exited with error: {result.stderr.decode(CLI_ENCODING)}"
     for test_string in test_vector.must_include:
         assert test_string in stdout
     for test_string in test_vector.must_not_include:
@@ -128,19 +149,15 @@ def test_input_from_stdin_without_hints(shared_tmp_dir, test_vector) -> None:
     skip_remote,
     reason="do not run tests that query external urls",
 )
-@pytest.mark.parametrize("test_vector", CLI_TEST_VECTORS)
+@pytest.mark.parametrize("test_vector", vector_params(CLI_TEST_VECTORS))
 def test_convert_url(shared_tmp_dir, test_vector):
     """Test the conversion of a stream with no stream info."""
     # Note: tmp_dir is not used here, but is needed to match the signature
 
     time.sleep(1)  # Ensure we don't hit rate limits
-    result = subprocess.run(
-        ["python", "-m", "markitdown", TEST_FILES_URL + "/" + test_vector.filename],
-        capture_output=True,
-        text=False,
-    )
+    result = run_cli([TEST_FILES_URL + "/" + test_vector.filename])
 
-    stdout = result.stdout.decode(locale.getpreferredencoding())
+    stdout = result.stdout.decode(CLI_ENCODING)
     assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
     for test_string in test_vector.must_include:
         assert test_string in stdout
@@ -148,38 +165,31 @@ def test_convert_url(shared_tmp_dir, test_vector):
         assert test_string not in stdout
 
 
-@pytest.mark.parametrize("test_vector", DATA_URI_TEST_VECTORS)
-def test_output_to_file_with_data_uris(shared_tmp_dir, test_vector) -> None:
+@pytest.mark.parametrize("test_vector", vector_params(DATA_URI_TEST_VECTORS))
+def test_output_to_file_with_data_uris(tmp_path, test_vector) -> None:
     """Test CLI functionality when keep_data_uris is enabled"""
 
-    output_file = os.path.join(shared_tmp_dir, test_vector.filename + ".output")
-    result = subprocess.run(
+    output_file = os.path.join(tmp_path, test_vector.filename + ".output")
+    result = run_cli(
         [
-            "python",
-            "-m",
-            "markitdown",
             "--keep-data-uris",
             "-o",
             output_file,
             os.path.join(TEST_FILES_DIR, test_vector.filename),
         ],
-        capture_output=True,
         text=True,
     )
 
     assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
     assert os.path.exists(output_file), f"Output file not created: {output_file}"
 
-    with open(output_file, "r") as f:
+    with open(output_file, "r", encoding="utf-8") as f:
         output_data = f.read()
         for test_string in test_vector.must_include:
             assert test_string in output_data
         for test_string in test_vector.must_not_include:
             assert test_string not in output_data
 
-    os.remove(output_file)
-    assert not os.path.exists(output_file), f"Output file not deleted: {output_file}"
-
 
 if __name__ == "__main__":
     import tempfile
@@ -1,11 +1,30 @@
 #!/usr/bin/env python3 -m pytest
 import io
+import codecs
+import dataclasses
+import functools
+import gc
 import os
+import base64
 import re
+import sys
 import shutil
+import subprocess
+import warnings
+import weakref
 import pytest
+from bs4 import XMLParsedAsHTMLWarning
+from urllib.parse import quote
 
 from markitdown._uri_utils import parse_data_uri, file_uri_to_path
+from markitdown.converters import (
+    CsvConverter,
+    OutlookMsgConverter,
+    PlainTextConverter,
+    _doc_intel_converter,
+    _exiftool,
+)
+from markitdown.converters._csv_converter import CHARSET_DETECTION_SAMPLE_SIZE
 
 from markitdown import (
     MarkItDown,
@@ -23,18 +42,23 @@ skip_remote = (
 )  # Don't run these tests in CI
 
 
-# Don't run the llm tests without a key and the client library
+# Don't run the llm tests without a key and the client library. Without a key,
+# don't import the (heavy) client library at all.
 skip_llm = False if os.environ.get("OPENAI_API_KEY") else True
-try:
-    import openai
-except ModuleNotFoundError:
-    skip_llm = True
+if not skip_llm:
+    try:
+        import openai
+    except ModuleNotFoundError:
+        skip_llm = True
 
 # Skip exiftool tests if not installed
 skip_exiftool = shutil.which("exiftool") is None
 
 TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
 
+# Stands in for exiftool when testing how markitdown drives it
+FAKE_EXIFTOOL = os.path.join(os.path.dirname(__file__), "_fake_exiftool.py")
+
 JPG_TEST_EXIFTOOL = {
     "Author": "AutoGen Authors",
     "Title": "AutoGen: Enabling Next-Gen LLM Applications via Multi-Agent Conversation",
@@ -218,6 +242,23 @@ def test_data_uris() -> None:
     assert attributes["charset"] == "utf-8"
     assert data == b"Hello, World!"
 
+    # Large payloads are decoded in full
+    payload = b"Hello, World!" * (1 << 17)
+    data_uri = "data:application/octet-stream;base64," + base64.b64encode(
+        payload
+    ).decode("ascii")
+    mime_type, attributes, data = parse_data_uri(data_uri)
+    assert mime_type == "application/octet-stream"
+    assert len(attributes) == 0
+    assert data == payload
+
+    # ... and split at the first ',' only, even when the data has commas
+    data_uri = "data:text/plain;charset=utf-8," + quote(payload, safe=",")
+    mime_type, attributes, data = parse_data_uri(data_uri)
+    assert mime_type == "text/plain"
+    assert attributes == {"charset": "utf-8"}
+    assert data == payload
+
 
 def test_file_uris() -> None:
     # Test file URI with an empty host
@@ -273,6 +314,18 @@ def test_docx_equations() -> None:
     assert block_equations, "No block equations found in the document."
 
 
+def test_xhtml_without_warnings() -> None:
+    # XHTML (e.g., EPUB chapters) is parsed as HTML on purpose, so bs4's
+    # XMLParsedAsHTMLWarning shouldn't reach the caller
+    markitdown = MarkItDown()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        result = markitdown.convert(os.path.join(TEST_FILES_DIR, "test.epub"))
+
+    assert "# Chapter 1: Test Content" in result.markdown
+    assert not [w for w in caught if issubclass(w.category, XMLParsedAsHTMLWarning)]
+
+
 def test_input_as_strings() -> None:
     markitdown = MarkItDown()
 
@@ -286,6 +339,62 @@ def test_input_as_strings() -> None:
     result = markitdown.convert_stream(io.BytesIO(input_data))
     assert "# Test" in result.text_content
 
+    # Test input too short to be worth running through magika
+    input_data = b"Hello!"
+    result = markitdown.convert_stream(io.BytesIO(input_data))
+    assert "Hello!" in result.text_content
+
+    # Test text with a BOM, but malformed data after it
+    input_data = codecs.BOM_UTF16_LE + "Hello!".encode("utf-16-le")[:-1]
+    result = markitdown.convert_stream(
+        io.BytesIO(input_data), stream_info=StreamInfo(extension=".txt")
+    )
+    assert "Hello" in result.text_content
+
+
+def test_plain_text_decoding() -> None:
+    # Without a charset, the converter falls back to its own decoding
+    converter = PlainTextConverter()
+    stream_info = StreamInfo(extension=".txt")
+    text = "Hello, world! This is plain text."
+
+    # UTF-32 with a BOM, which starts with the UTF-16-LE BOM
+    result = converter.convert(io.BytesIO(text.encode("utf-32")), stream_info)
+    assert result.markdown == text
+
+    # BOM-less UTF-16, which is also valid UTF-8
+    result = converter.convert(io.BytesIO(text.encode("utf-16-le")), stream_info)
+    assert result.markdown == text
+
+
+def test_csv_charset_sample_boundary() -> None:
+    # The charset detection sample ends partway through a multibyte character
+    row = "カタカナ,ひらがな\n"
+    data = b"x" + (row * (CHARSET_DETECTION_SAMPLE_SIZE // 10)).encode("utf-8")
+    assert data[CHARSET_DETECTION_SAMPLE_SIZE] & 0xC0 == 0x80
+
+    result = CsvConverter().convert(io.BytesIO(data), StreamInfo(extension=".csv"))
+    lines = result.markdown.splitlines()
+    assert lines[0] == "| xカタカナ | ひらがな |"
+    assert lines[2:] == ["| カタカナ | ひらがな |"] * (len(lines) - 2)
+
+
+def test_large_notebook_stream() -> None:
+    markitdown = MarkItDown()
+
+    # The nbformat keys are only checked near the start and end of the stream
+    cells = [
+        f'{{"cell_type": "code", "source": ["print({i})\\n"]}}' for i in range(5000)
+    ]
+    input_data = (
+        '{"cells": [' + ", ".join(cells) + '], "metadata": {}, '
+        '"nbformat": 4, "nbformat_minor": 5}'
+    ).encode("utf-8")
+    result = markitdown.convert_stream(
+        io.BytesIO(input_data), stream_info=StreamInfo(mimetype="application/json")
+    )
+    assert "```python\nprint(4999)\n\n```" in result.text_content
+
 
 @pytest.mark.skipif(
     skip_remote,
@@ -340,6 +449,54 @@ def test_exceptions() -> None:
     assert type(exc_info.value.attempts[0].converter).__name__ == "PptxConverter"
 
 
+def test_outlook_msg_accepts_releases_stream() -> None:
+    pytest.importorskip("olefile")
+
+    # Detecting a .msg by its content opens it with olefile, but nothing should
+    # keep a reference to the stream once accepts() returns
+    with open(os.path.join(TEST_FILES_DIR, "test_outlook_msg.msg"), "rb") as fh:
+        file_stream = io.BytesIO(fh.read())
+    converter = OutlookMsgConverter()
+    assert converter.accepts(file_stream, StreamInfo())
+    assert file_stream.tell() == 0
+
+    stream_ref = weakref.ref(file_stream)
+    del file_stream
+    gc.collect()
+    assert stream_ref() is None
+
+
+@pytest.mark.skipif(
+    _doc_intel_converter._dependency_exc_info is not None,
+    reason="do not run if the Document Intelligence SDK is not installed",
+)
+def test_doc_intel_client_sharing(monkeypatch) -> None:
+    monkeypatch.setattr(_doc_intel_converter, "_clients", {})
+    get_client = functools.partial(
+        _doc_intel_converter._get_client,
+        endpoint="https://example.cognitiveservices.azure.com/",
+        api_version="2024-07-31-preview",
+    )
+
+    # Credentials that define __eq__ (e.g., dataclasses) aren't hashable
+    @dataclasses.dataclass
+    class Credential:
+        token: str
+
+        def get_token(self, *scopes, **kwargs):
+            raise NotImplementedError()
+
+    credential = Credential("token")
+    client = get_client(credential=credential, api_key=None)
+    assert get_client(credential=credential, api_key=None) is client
+    assert get_client(credential=Credential("token"), api_key=None) is not client
+
+    # Clients for an API key are shared, but the key isn't kept in the cache
+    client = get_client(credential=None, api_key="secret-key")
+    assert get_client(credential=None, api_key="secret-key") is client
+    assert "secret-key" not in repr(list(_doc_intel_converter._clients))
+
+
 @pytest.mark.skipif(
     skip_exiftool,
     reason="do not run if exiftool is not installed",
@@ -370,6 +527,95 @@ def test_markitdown_exiftool() -> None:
         assert target in result.text_content
 
 
+@pytest.fixture
+def fake_exiftool(tmp_path):
+    """An executable that runs _fake_exiftool.py with this interpreter."""
+    wrapper = tmp_path / "exiftool"
+    wrapper.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_EXIFTOOL}" "$@"\n')
+    wrapper.chmod(0o755)
+    yield str(wrapper)
+    _exiftool._close_processes()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs a POSIX shell")
+def test_exiftool_stay_open(fake_exiftool) -> None:
+    jpg_path = os.path.join(TEST_FILES_DIR, "test.jpg")
+    with open(jpg_path, "rb") as stream:
+        first = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+        assert stream.tell() == 0
+        second = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+
+    # Both requests are answered by the same persistent process
+    assert first["Mode"] == "stay_open"
+    assert first["FileSize"] == os.path.getsize(jpg_path)
+    assert second["Pid"] == first["Pid"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs a POSIX shell")
+def test_exiftool_source_file(fake_exiftool) -> None:
+    jpg_path = os.path.join(TEST_FILES_DIR, "test.jpg")
+
+    # A local file is read by exiftool in place
+    with open(jpg_path, "rb") as stream:
+        metadata = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+    assert metadata["SourceFile"] == os.path.abspath(jpg_path)
+
+    # ... while other streams are copied to a temporary file
+    with open(jpg_path, "rb") as fh:
+        stream = io.BytesIO(fh.read())
+    metadata = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+    assert metadata["SourceFile"] != os.path.abspath(jpg_path)
+    assert not os.path.exists(metadata["SourceFile"])
+    assert metadata["FileSize"] == os.path.getsize(jpg_path)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs a POSIX shell")
+def test_exiftool_restart(fake_exiftool) -> None:
+    with open(os.path.join(TEST_FILES_DIR, "test.jpg"), "rb") as stream:
+        first = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+
+        # A process that has died is replaced on next use
+        process = _exiftool._processes[fake_exiftool]._process
+        process.kill()
+        process.wait()
+
+        second = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+
+    assert second["Mode"] == "stay_open"
+    assert second["Pid"] != first["Pid"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs a POSIX shell")
+def test_exiftool_one_shot_fallback(fake_exiftool, monkeypatch) -> None:
+    monkeypatch.setenv("FAKE_EXIFTOOL_MODE", "no_stay_open")
+
+    jpg_path = os.path.join(TEST_FILES_DIR, "test.jpg")
+    with open(jpg_path, "rb") as stream:
+        metadata = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+        assert stream.tell() == 0
+
+    assert metadata["Mode"] == "one_shot"
+    assert metadata["FileSize"] == os.path.getsize(jpg_path)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs a POSIX shell")
+def test_exiftool_timeout(fake_exiftool, monkeypatch) -> None:
+    monkeypatch.setattr(_exiftool, "EXIFTOOL_TIMEOUT", 0.5)
+    monkeypatch.setenv("FAKE_EXIFTOOL_MODE", "hang")
+
+    with open(os.path.join(TEST_FILES_DIR, "test.jpg"), "rb") as stream:
+        # A hung request is killed, rather than blocking every later one
+        with pytest.raises(subprocess.TimeoutExpired):
+            _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+        assert stream.tell() == 0
+
+        # ... and the next request starts a new process
+        monkeypatch.delenv("FAKE_EXIFTOOL_MODE")
+        metadata = _exiftool.exiftool_metadata(stream, exiftool_path=fake_exiftool)
+
+    assert metadata["Mode"] == "stay_open"
+
+
 @pytest.mark.skipif(
     skip_llm,
     reason="do not run llm tests without a key",
@@ -404,6 +650,7 @@ if __name__ == "__main__":
         test_file_uris,
         test_docx_comments,
         test_input_as_strings,
+        test_large_notebook_stream,
         test_markitdown_remote,
         test_speech_transcription,
         test_exceptions,
@@ -7,9 +7,17 @@ import base64
 from pathlib import Path
 
 if __name__ == "__main__":
-    from _test_vectors import GENERAL_TEST_VECTORS, DATA_URI_TEST_VECTORS
+    from _test_vectors import (
+        GENERAL_TEST_VECTORS,
+        DATA_URI_TEST_VECTORS,
+        vector_params,
+    )
 else:
-    from ._test_vectors import GENERAL_TEST_VECTORS, DATA_URI_TEST_VECTORS
+    from ._test_vectors import (
+        GENERAL_TEST_VECTORS,
+        DATA_URI_TEST_VECTORS,
+        vector_params,
+    )
 
 from markitdown import (
     MarkItDown,
@@ -24,10 +32,16 @@ TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
 TEST_FILES_URL = "https://raw.githubusercontent.com/microsoft/markitdown/refs/heads/main/packages/markitdown/tests/test_files"
 
 
-@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
-def test_guess_stream_info(test_vector):
+@pytest.fixture(scope="module")
+def markitdown():
+    # Shared by every test in this module (building one loads magika's model),
+    # so tests must not register converters or otherwise modify it
+    return MarkItDown()
+
+
+@pytest.mark.parametrize("test_vector", vector_params(GENERAL_TEST_VECTORS))
+def test_guess_stream_info(markitdown, test_vector):
     """Test the ability to guess stream info."""
-    markitdown = MarkItDown()
 
     local_path = os.path.join(TEST_FILES_DIR, test_vector.filename)
     expected_extension = os.path.splitext(test_vector.filename)[1]
@@ -54,10 +68,9 @@ def test_guess_stream_info(test_vector):
         assert guesses[0].charset == test_vector.charset
 
 
-@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
-def test_convert_local(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(GENERAL_TEST_VECTORS))
+def test_convert_local(markitdown, test_vector):
     """Test the conversion of a local file."""
-    markitdown = MarkItDown()
 
     result = markitdown.convert(
         os.path.join(TEST_FILES_DIR, test_vector.filename), url=test_vector.url
@@ -68,10 +81,9 @@ def test_convert_local(test_vector):
         assert string not in result.markdown
 
 
-@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
-def test_convert_stream_with_hints(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(GENERAL_TEST_VECTORS))
+def test_convert_stream_with_hints(markitdown, test_vector):
     """Test the conversion of a stream with full stream info."""
-    markitdown = MarkItDown()
 
     stream_info = StreamInfo(
         extension=os.path.splitext(test_vector.filename)[1],
@@ -89,10 +101,9 @@ def test_convert_stream_with_hints(test_vector):
             assert string not in result.markdown
 
 
-@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
-def test_convert_stream_without_hints(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(GENERAL_TEST_VECTORS))
+def test_convert_stream_without_hints(markitdown, test_vector):
     """Test the conversion of a stream with no stream info."""
-    markitdown = MarkItDown()
 
     with open(os.path.join(TEST_FILES_DIR, test_vector.filename), "rb") as stream:
         result = markitdown.convert(stream, url=test_vector.url)
@@ -106,10 +117,9 @@ def test_convert_stream_without_hints(test_vector):
     skip_remote,
     reason="do not run tests that query external urls",
 )
-@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
-def test_convert_http_uri(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(GENERAL_TEST_VECTORS))
+def test_convert_http_uri(markitdown, test_vector):
     """Test the conversion of an HTTP:// or HTTPS:// URI."""
-    markitdown = MarkItDown()
 
     time.sleep(1)  # Ensure we don't hit rate limits
 
@@ -123,10 +133,9 @@ def test_convert_http_uri(test_vector):
         assert string not in result.markdown
 
 
-@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
-def test_convert_file_uri(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(GENERAL_TEST_VECTORS))
+def test_convert_file_uri(markitdown, test_vector):
     """Test the conversion of a file:// URI."""
-    markitdown = MarkItDown()
 
     result = markitdown.convert(
         Path(os.path.join(TEST_FILES_DIR, test_vector.filename)).as_uri(),
@@ -138,14 +147,13 @@ def test_convert_file_uri(test_vector):
         assert string not in result.markdown
 
 
-@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
-def test_convert_data_uri(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(GENERAL_TEST_VECTORS))
+def test_convert_data_uri(markitdown, test_vector):
     """Test the conversion of a data URI."""
-    markitdown = MarkItDown()
 
     data = ""
     with open(os.path.join(TEST_FILES_DIR, test_vector.filename), "rb") as stream:
-        data = base64.b64encode(stream.read()).decode("utf-8")
+        data = base64.b64encode(stream.read()).decode("ascii")
     mimetype = test_vector.mimetype
     data_uri = f"data:{mimetype};base64,{data}"
 
@@ -159,10 +167,9 @@ def test_convert_data_uri(test_vector):
         assert string not in result.markdown
 
 
-@pytest.mark.parametrize("test_vector", DATA_URI_TEST_VECTORS)
-def test_convert_keep_data_uris(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(DATA_URI_TEST_VECTORS))
+def test_convert_keep_data_uris(markitdown, test_vector):
     """Test API functionality when keep_data_uris is enabled"""
-    markitdown = MarkItDown()
 
     # Test local file conversion
     result = markitdown.convert(
@@ -177,10 +184,9 @@ def test_convert_keep_data_uris(test_vector):
         assert string not in result.markdown
 
 
-@pytest.mark.parametrize("test_vector", DATA_URI_TEST_VECTORS)
-def test_convert_stream_keep_data_uris(test_vector):
+@pytest.mark.parametrize("test_vector", vector_params(DATA_URI_TEST_VECTORS))
+def test_convert_stream_keep_data_uris(markitdown, test_vector):
     """Test the conversion of a stream with no stream info."""
-    markitdown = MarkItDown()
 
     stream_info = StreamInfo(
         extension=os.path.splitext(test_vector.filename)[1],
@@ -201,6 +207,7 @@ def test_convert_stream_keep_data_uris(test_vector):
 
 if __name__ == "__main__":
     """Runs this file's tests from the command line."""
+    markitdown_instance = MarkItDown()
 
     # General tests
     for test_function in [
@@ -216,7 +223,7 @@ if __name__ == "__main__":
             print(
                 f"Running {test_function.__name__} on {test_vector.filename}...", end=""
             )
-            test_function(test_vector)
+            test_function(markitdown_instance, test_vector)
             print("OK")
 
     # Data URI tests
@@ -228,7 +235,7 @@ if __name__ == "__main__":
             print(
                 f"Running {test_function.__name__} on {test_vector.filename}...", end=""
             )
-            test_function(test_vector)
+            test_function(markitdown_instance, test_vector)
             print("OK")
 
     print("All tests passed!")